@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Test script for CEO briefing generation functionality.
+"""
+
+import json
+import sys
+import shutil
+from pathlib import Path
+from datetime import date, timedelta
+
+# Add the project root to the path to import from other modules
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.ceo_briefing_generator import CEOBriefingGenerator, WeeklyAuditData, _count_md
+
+
+def _make_vault(name: str) -> Path:
+    vault = Path(name)
+    vault.mkdir(parents=True, exist_ok=True)
+    return vault
+
+
+def test_count_md():
+    """Test markdown file counting, including missing directories."""
+    print("Testing markdown counting...")
+
+    vault = _make_vault("./test_briefing_count_vault")
+    target = vault / "Pending_Approval"
+    target.mkdir(exist_ok=True)
+    (target / "a.md").write_text("# A")
+    (target / "b.md").write_text("# B")
+    (target / "notes.txt").write_text("not markdown")
+
+    assert _count_md(target) == 2, "Only .md files should be counted"
+    assert _count_md(vault / "Missing") == 0, "Missing directory should count as 0"
+
+    print("✓ Markdown counting works")
+
+    shutil.rmtree(vault, ignore_errors=True)
+    return True
+
+
+def test_parse_plan_file():
+    """Test parsing of a plan document into a project status."""
+    print("\nTesting plan file parsing...")
+
+    generator = CEOBriefingGenerator("./test_briefing_parse_vault")
+
+    content = (
+        "# Launch Campaign\n\n"
+        "## Tasks\n"
+        "- [x] Define objectives\n"
+        "- [X] Identify audience\n"
+        "- [ ] Develop content strategy\n"
+        "- [ ] Create materials\n"
+        "- [ ] Launch campaign\n"
+        "- [ ] Monitor results\n\n"
+        "## Blockers\n"
+        "- Waiting on budget approval\n"
+    )
+
+    status = generator._parse_plan_file("PLAN_Launch", content)
+
+    assert status.name == "Launch Campaign", "Name should come from the H1 heading"
+    assert status.completed_tasks == 2, "Both [x] and [X] boxes should count"
+    assert status.pending_tasks == 4, "Unchecked boxes should be counted"
+    assert len(status.next_steps) == 3, "Next steps should be capped at 3"
+    assert status.next_steps[0] == "Develop content strategy"
+    assert status.blockers == ["Waiting on budget approval"], "Blockers should be extracted"
+
+    print("✓ Plan file parsing works")
+
+    shutil.rmtree(Path("./test_briefing_parse_vault"), ignore_errors=True)
+    return True
+
+
+def test_detect_bottlenecks():
+    """Test bottleneck detection from pending approvals and blockers."""
+    print("\nTesting bottleneck detection...")
+
+    vault = _make_vault("./test_briefing_bottleneck_vault")
+    pending = vault / "Pending_Approval"
+    pending.mkdir(exist_ok=True)
+    for i in range(12):
+        (pending / f"approval_{i}.md").write_text(f"# Approval {i}")
+
+    generator = CEOBriefingGenerator(str(vault))
+    week_end = date.today()
+    audit_result = WeeklyAuditData(week_start=week_end - timedelta(days=6), week_end=week_end)
+
+    bottlenecks = generator.detect_bottlenecks(audit_result, [])
+
+    assert len(bottlenecks) == 1, "Backed-up approvals should be a bottleneck"
+    assert bottlenecks[0].severity == 'high', "More than 10 pending approvals is high severity"
+    assert "12" in bottlenecks[0].description
+
+    print("✓ Bottleneck detection works")
+
+    shutil.rmtree(vault, ignore_errors=True)
+    return True
+
+
+def test_find_repeat_customers():
+    """Test repeat-customer detection from the structured logs."""
+    print("\nTesting repeat customer detection...")
+
+    vault = _make_vault("./test_briefing_customers_vault")
+    log_dir = vault / "Logs"
+    log_dir.mkdir(exist_ok=True)
+
+    week_end = date.today()
+    log_file = log_dir / f"{week_end.strftime('%Y-%m-%d')}.json"
+    with open(log_file, 'w', encoding='utf-8') as f:
+        for _ in range(4):
+            f.write(json.dumps({
+                'action': 'email_receive',
+                'parameters': {'from': 'Client A <client@example.com>'},
+            }) + '\n')
+        f.write(json.dumps({
+            'action': 'email_receive',
+            'parameters': {'from': 'once@example.com'},
+        }) + '\n')
+        f.write(json.dumps({'action': 'linkedin_post', 'parameters': {}}) + '\n')
+
+    generator = CEOBriefingGenerator(str(vault))
+    audit_result = WeeklyAuditData(week_start=week_end - timedelta(days=6), week_end=week_end)
+
+    repeat = generator._find_repeat_customers(audit_result)
+
+    assert repeat == {'client@example.com': 4}, f"Only senders with >3 emails should appear, got {repeat}"
+
+    print("✓ Repeat customer detection works")
+
+    shutil.rmtree(vault, ignore_errors=True)
+    return True
+
+
+def test_generate_ceo_briefing():
+    """Test end-to-end generation of the CEO briefing file."""
+    print("\nTesting CEO briefing generation...")
+
+    vault = _make_vault("./test_briefing_e2e_vault")
+    plans = vault / "Plans"
+    plans.mkdir(exist_ok=True)
+    (plans / "PLAN_Alpha.md").write_text(
+        "# Project Alpha\n\n- [x] Kickoff\n- [ ] Build prototype\n"
+    )
+
+    generator = CEOBriefingGenerator(str(vault))
+    briefing_path = generator.generate_ceo_briefing()
+
+    assert briefing_path is not None, "Briefing should be generated"
+    assert briefing_path.exists(), "Briefing file should exist"
+
+    content = briefing_path.read_text()
+    assert "# Monday Morning CEO Briefing" in content, "Briefing should have the title"
+    assert "## Executive Summary" in content, "Briefing should have an Executive Summary"
+    assert "## Projects" in content, "Briefing should have a Projects section"
+    assert "Project Alpha" in content, "Plan should appear in the Projects section"
+    assert "## Bottlenecks" in content, "Briefing should have a Bottlenecks section"
+    assert "## Proactive Suggestions" in content, "Briefing should have a Suggestions section"
+
+    print("✓ CEO briefing generation works")
+
+    shutil.rmtree(vault, ignore_errors=True)
+    return True
+
+
+def main():
+    """Main test function."""
+    print("Testing CEO Briefing Functionality")
+    print("=" * 60)
+
+    tests = [
+        test_count_md,
+        test_parse_plan_file,
+        test_detect_bottlenecks,
+        test_find_repeat_customers,
+        test_generate_ceo_briefing,
+    ]
+
+    all_passed = True
+    for test in tests:
+        if not test():
+            all_passed = False
+
+    print("\n" + "=" * 60)
+    if all_passed:
+        print("✓ All briefing functionality tests passed!")
+        return 0
+    else:
+        print("✗ Some briefing functionality tests failed!")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Test script for Gmail to Odoo invoice parsing functionality.
+"""
+
+import sys
+import shutil
+from pathlib import Path
+from datetime import date, timedelta
+
+# Add the project root to the path to import from other modules
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.gmail_to_odoo_parser import (
+    detect_invoice_request,
+    extract_invoice_details,
+    create_invoice_draft,
+)
+
+
+def _invoice_email():
+    return {
+        'id': 'msg_test_001',
+        'subject': 'Invoice request for consulting',
+        'from': 'Jane Client <jane@example.com>',
+        'body': 'Hi, please send an invoice for last month.\n'
+                '2 x Consulting day @ $800\n'
+                'Net 30 days please.\nThanks!',
+    }
+
+
+def test_detect_invoice_request():
+    """Test detection of invoice requests versus ordinary emails."""
+    print("Testing invoice request detection...")
+
+    is_invoice, confidence = detect_invoice_request(_invoice_email())
+    assert is_invoice, "Invoice request email should be detected"
+    assert confidence >= 0.5, f"Confidence should be at least 0.5, got {confidence}"
+
+    ordinary = {
+        'id': 'msg_test_002',
+        'subject': 'Lunch on Friday?',
+        'from': 'friend@example.com',
+        'body': 'Want to grab lunch at noon on Friday?',
+    }
+    is_invoice, confidence = detect_invoice_request(ordinary)
+    assert not is_invoice, "Ordinary email should not be detected"
+    assert confidence == 0.0, "Ordinary email should have zero confidence"
+
+    print("✓ Invoice request detection works")
+    return True
+
+
+def test_extract_invoice_details():
+    """Test extraction of customer, amounts, due dates, and line items."""
+    print("\nTesting invoice detail extraction...")
+
+    details = extract_invoice_details(_invoice_email())
+
+    assert details.customer_name == "Jane Client", "Sender display name should be the customer"
+    assert details.customer_email == "jane@example.com", "Sender address should be extracted"
+    assert len(details.line_items) == 1, "Line item should be extracted"
+    assert details.line_items[0].quantity == 2, "Quantity should be parsed"
+    assert details.line_items[0].unit_price == 800.0, "Unit price should be parsed"
+    assert details.total_amount == 1600.0, "Total should come from the line items"
+
+    expected_due = (date.today() + timedelta(days=30)).isoformat()
+    assert details.due_date == expected_due, "Net 30 should set the due date 30 days out"
+    assert details.is_complete, "Details with customer and amount should be complete"
+
+    print("✓ Invoice detail extraction works")
+    return True
+
+
+def test_create_invoice_draft():
+    """Test end-to-end creation of the draft invoice file."""
+    print("\nTesting invoice draft creation...")
+
+    vault = Path("./test_invoice_vault")
+    vault.mkdir(parents=True, exist_ok=True)
+
+    email = _invoice_email()
+    details = extract_invoice_details(email)
+    draft_path = create_invoice_draft(str(vault), email, details)
+
+    assert draft_path is not None, "Draft should be created"
+    assert draft_path.exists(), "Draft file should exist"
+    assert draft_path.parent.name == "Pending_Approval", "Draft should await approval"
+
+    content = draft_path.read_text()
+    assert "type: odoo_invoice_draft" in content, "Draft should have frontmatter"
+    assert "# Draft Invoice: Jane Client" in content, "Draft should have a title"
+    assert "Consulting day" in content, "Line item should appear in the table"
+    assert "$1600.00" in content, "Total should appear in the draft"
+
+    print("✓ Invoice draft creation works")
+
+    shutil.rmtree(vault, ignore_errors=True)
+    return True
+
+
+def main():
+    """Main test function."""
+    print("Testing Gmail to Odoo Invoice Parsing")
+    print("=" * 60)
+
+    tests = [
+        test_detect_invoice_request,
+        test_extract_invoice_details,
+        test_create_invoice_draft,
+    ]
+
+    all_passed = True
+    for test in tests:
+        if not test():
+            all_passed = False
+
+    print("\n" + "=" * 60)
+    if all_passed:
+        print("✓ All invoice parsing tests passed!")
+        return 0
+    else:
+        print("✗ Some invoice parsing tests failed!")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,315 @@
+"""
+Audit Generator Module for the Personal AI Employee system.
+Generates the Weekly Business Audit report from the vault's structured action logs.
+"""
+
+import atexit
+import json
+import logging
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from utils.setup_logger import setup_logger, log_structured_action
+
+# Shared read-only sentinel so missing/null 'result' fields do not allocate
+# a fresh empty dict per entry in the metrics hot loop.
+_EMPTY: Dict = {}
+
+# Single-worker pool so the structured-log append at the end of an audit run
+# does not block the caller; flushed on interpreter exit.
+_LOG_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix='audit-log')
+atexit.register(_LOG_POOL.shutdown, wait=True)
+
+# Lazily-created singleton pool for parsing daily log files, so back-filling
+# many weeks in a loop does not spawn and tear down 7 threads per week.
+_PARSE_POOL: Optional[ThreadPoolExecutor] = None
+
+
+def _get_parse_pool() -> ThreadPoolExecutor:
+    """Get (lazily creating) the shared log-parsing thread pool."""
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        _PARSE_POOL = ThreadPoolExecutor(max_workers=7, thread_name_prefix='audit-parse')
+    return _PARSE_POOL
+
+
+@dataclass
+class AuditMetrics:
+    """Aggregated metrics for one week of structured action log entries."""
+    total_actions: int = 0
+    successful_actions: int = 0
+    failed_actions: int = 0
+    actions_by_type: Dict[str, int] = field(default_factory=Counter)
+    actions_by_actor: Dict[str, int] = field(default_factory=Counter)
+    errors_by_service: Dict[str, int] = field(default_factory=Counter)
+
+
+class AuditGenerator:
+    """
+    Class to generate weekly business audit reports from daily action logs.
+    """
+
+    def __init__(self, vault_path: str):
+        """
+        Initialize the audit generator.
+
+        Args:
+            vault_path: Path to the Obsidian vault
+        """
+        self.vault_path = Path(vault_path)
+        self.logger = setup_logger("AuditGenerator", level=logging.INFO)
+
+        # Directory where generated audit reports are stored
+        self.audits_dir = self.vault_path / "Audits"
+
+    def parse_logs_for_week(self, week_end: Optional[date] = None) -> Tuple[List[Dict], bool]:
+        """
+        Parse the daily structured log files for the 7 days ending at week_end.
+
+        Args:
+            week_end: Last day of the week to audit (default: today)
+
+        Returns:
+            Tuple of (entries, partial) where entries is the combined list of
+            log entries and partial indicates that some day files were missing
+        """
+        if week_end is None:
+            week_end = date.today()
+
+        log_dir = self.vault_path / "Logs"
+        dates = [week_end - timedelta(days=offset) for offset in range(6, -1, -1)]
+
+        # One directory read instead of a stat() per expected date
+        try:
+            with os.scandir(log_dir) as it:
+                present = {dir_entry.name for dir_entry in it if dir_entry.name.endswith('.json')}
+        except FileNotFoundError:
+            present = set()
+
+        expected = [f"{day.strftime('%Y-%m-%d')}.json" for day in dates]
+        to_load = [log_dir / name for name in expected if name in present]
+        partial = len(to_load) != len(dates)
+
+        entries: List[Dict] = []
+        executor = _get_parse_pool()
+        futures = [executor.submit(self._parse_and_reduce, log_file) for log_file in to_load]
+        for future in futures:
+            entries.extend(future.result())
+
+        return entries, partial
+
+    def _parse_and_reduce(self, log_file: Path) -> List[Dict]:
+        """
+        Parse one daily log file (one JSON object per line) into entries.
+
+        Args:
+            log_file: Path to the daily log file
+
+        Returns:
+            List of parsed log entry dictionaries
+        """
+        day_entries: List[Dict] = []
+        try:
+            with open(log_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Skip malformed lines
+                    # Action/actor strings come from a small fixed vocabulary;
+                    # interning them lets the Counter lookups in
+                    # calculate_metrics hit the identity fast path.
+                    action = entry.get('action')
+                    if type(action) is str:
+                        entry['action'] = sys.intern(action)
+                    actor = entry.get('actor')
+                    if type(actor) is str:
+                        entry['actor'] = sys.intern(actor)
+                    day_entries.append(entry)
+        except IOError as e:
+            self.logger.warning(f"Could not read log file {log_file}: {e}")
+
+        return day_entries
+
+    def calculate_metrics(self, entries: List[Dict]) -> AuditMetrics:
+        """
+        Aggregate log entries into weekly audit metrics.
+
+        Args:
+            entries: List of structured log entries
+
+        Returns:
+            AuditMetrics with per-type, per-actor, and per-service counts
+        """
+        metrics = AuditMetrics()
+
+        for entry in entries:
+            entry_get = entry.get
+            action = entry_get('action', 'unknown')
+            actor = entry_get('actor', 'unknown')
+            service = entry_get('service', 'unknown') or 'unknown'
+            result = entry_get('result') or _EMPTY
+            status = result.get('status', '')
+
+            metrics.total_actions += 1
+            metrics.actions_by_type[action] += 1
+            metrics.actions_by_actor[actor] += 1
+
+            if status == 'success':
+                metrics.successful_actions += 1
+            elif status in ('failure', 'error'):
+                metrics.failed_actions += 1
+                metrics.errors_by_service[service] += 1
+
+        return metrics
+
+    def generate_audit_markdown(self, metrics: AuditMetrics, week_end: date, partial: bool) -> str:
+        """
+        Create the markdown content for the weekly audit report.
+
+        Args:
+            metrics: Aggregated audit metrics
+            week_end: Last day of the audited week
+            partial: Whether some daily log files were missing
+
+        Returns:
+            Markdown content string
+        """
+        week_start = week_end - timedelta(days=6)
+
+        content = "# Weekly Business Audit\n\n"
+        content += f"**Period**: {week_start.strftime('%Y-%m-%d')} to {week_end.strftime('%Y-%m-%d')}\n"
+        content += f"**Generated**: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC\n\n"
+
+        if partial:
+            content += "> Note: Log files for some days of this week were missing; totals are partial.\n\n"
+
+        content += "## Summary\n"
+        content += f"- **Total actions**: {metrics.total_actions}\n"
+        content += f"- **Successful**: {metrics.successful_actions}\n"
+        content += f"- **Failed**: {metrics.failed_actions}\n"
+        if metrics.total_actions > 0:
+            success_rate = metrics.successful_actions / metrics.total_actions * 100
+            content += f"- **Success rate**: {success_rate:.1f}%\n"
+        content += "\n"
+
+        content += "## Top Actions\n"
+        top_actions = sorted(metrics.actions_by_type.items(), key=lambda kv: kv[1], reverse=True)[:20]
+        for action, count in top_actions:
+            content += f"- **{action}**: {count}\n"
+        if not top_actions:
+            content += "- No actions recorded this week\n"
+        content += "\n"
+
+        content += "## Errors by Service\n"
+        error_services = sorted(metrics.errors_by_service.items(), key=lambda kv: kv[1], reverse=True)
+        for service, count in error_services:
+            content += f"- **{service}**: {count} errors\n"
+        if not error_services:
+            content += "- No errors recorded this week\n"
+        content += "\n"
+
+        content += "## Actions by Actor\n"
+        for actor, count in sorted(metrics.actions_by_actor.items(), key=lambda kv: kv[1], reverse=True):
+            content += f"- **{actor}**: {count}\n"
+
+        return content
+
+    def generate_weekly_audit(self, week_end: Optional[date] = None) -> Optional[Path]:
+        """
+        Generate the weekly audit report and save it to the vault.
+
+        Args:
+            week_end: Last day of the week to audit (default: today)
+
+        Returns:
+            Path to the created audit report, or None on failure
+        """
+        t0 = time.perf_counter_ns()
+
+        if week_end is None:
+            week_end = date.today()
+
+        try:
+            entries, partial = self.parse_logs_for_week(week_end)
+            metrics = self.calculate_metrics(entries)
+
+            content = self.generate_audit_markdown(metrics, week_end, partial)
+
+            self.audits_dir.mkdir(parents=True, exist_ok=True)
+            report_path = self.audits_dir / f"{week_end.strftime('%Y-%m-%d')}_Weekly_Audit.md"
+            with open(report_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+
+            duration_ms = (time.perf_counter_ns() - t0) // 1_000_000
+            _LOG_POOL.submit(self._log_audit_generation, duration_ms, metrics)
+
+            self.logger.info(f"Generated weekly audit report: {report_path} ({duration_ms}ms)")
+            return report_path
+
+        except Exception as e:
+            self.logger.error(f"Error generating weekly audit: {e}")
+            return None
+
+    def _log_audit_generation(self, duration_ms: int, metrics: AuditMetrics):
+        """
+        Record the audit generation itself in the structured action log.
+
+        Args:
+            duration_ms: Time taken to generate the audit in milliseconds
+            metrics: The metrics that were aggregated
+        """
+        log_structured_action(
+            str(self.vault_path),
+            action='weekly_audit_generated',
+            actor='audit_generator',
+            service='audit',
+            parameters={
+                'duration_ms': duration_ms,
+                'total_actions': metrics.total_actions,
+                'failed_actions': metrics.failed_actions,
+            },
+            logger=self.logger,
+        )
+
+
+def get_audit_generator(vault_path: str) -> AuditGenerator:
+    """
+    Get an AuditGenerator instance for the specified vault.
+
+    Args:
+        vault_path: Path to the Obsidian vault
+
+    Returns:
+        AuditGenerator instance
+    """
+    return AuditGenerator(vault_path)
+
+
+if __name__ == "__main__":
+    # Example usage
+    import logging
+
+    # Set up logging
+    logging.basicConfig(level=logging.INFO)
+
+    # Create an audit generator
+    generator = AuditGenerator("./test_vault")
+
+    # Log a few example actions so the audit has something to report
+    log_structured_action("./test_vault", "email_send", actor="gmail_watcher", service="gmail")
+    log_structured_action("./test_vault", "plan_created", actor="plan_generator")
+
+    # Generate the weekly audit
+    report_path = generator.generate_weekly_audit()
+    print(f"Audit report: {report_path}")
@@ -0,0 +1,656 @@
+"""
+CEO Briefing Generator Module for the Personal AI Employee system.
+Generates the Monday Morning CEO Briefing from audit metrics, plan files,
+and pending vault activity.
+"""
+
+import logging
+import os
+import re
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from utils.setup_logger import setup_logger
+
+# Optional collaborators resolved once at import instead of per call; both
+# stay None when unavailable (e.g. when run outside the package layout).
+try:
+    from utils.setup_logger import log_structured_action as _log_action
+except ImportError:
+    try:
+        from setup_logger import log_structured_action as _log_action
+    except ImportError:
+        _log_action = None
+
+try:
+    from utils.audit_generator import AuditGenerator as _AuditGenerator
+except ImportError:
+    try:
+        from audit_generator import AuditGenerator as _AuditGenerator
+    except ImportError:
+        _AuditGenerator = None
+
+# orjson parses JSON log lines several times faster than stdlib json and
+# accepts bytes directly; fall back to stdlib when it is not installed.
+try:
+    from orjson import loads as _jloads
+except ImportError:
+    from json import loads as _jloads
+
+# Actions that represent an incoming email in the structured logs
+_EMAIL_ACTIONS = frozenset({'email_receive', 'gmail_receive'})
+
+# Cheap bytes-level prefilter matching both email_receive and gmail_receive;
+# lines without it cannot be email entries and skip the JSON parse entirely.
+_EMAIL_MARKER = b'mail_receive"'
+
+# Compiled once at import so plan/log parsing avoids the per-call overhead of
+# re-compiling (or re-looking-up) these patterns on every line.
+_BLOCKER_HEADING_RE = re.compile(r'(?:#+\s*[Bb]locker|\*\*[Bb]lockers?\*\*)')
+_EMAIL_RE = re.compile(r'[\w.+-]+@[\w-]+\.\w+')
+
+# Checkbox markers are literal prefixes; a tuple startswith stays entirely in
+# C string primitives instead of the regex engine.
+_CHECKED_PREFIXES = ('- [x]', '- [X]')
+
+# Common blocker-heading shapes as case-folded literal prefixes; the regex
+# only runs as a fallback for near-misses like '##blocker' without a space.
+_BLOCKER_PREFIXES = ('# blocker', '## blocker', '### blocker', '#### blocker', '**blocker')
+
+# Parsed plan files keyed by path -> (mtime_ns, ProjectStatus); plan documents
+# change rarely between briefings, so unchanged files skip the read and parse.
+_PLAN_CACHE: Dict[str, tuple] = {}
+
+# Shared presentation/sort tables, built once instead of per call
+_SEVERITY_EMOJI = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}
+_PRIORITY_EMOJI = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}
+_SEVERITY_ORDER = {'high': 0, 'medium': 1, 'low': 2}
+_PRIORITY_ORDER = {'high': 0, 'medium': 1, 'low': 2}
+
+
+@dataclass
+class ProjectStatus:
+    """Status summary for one plan document."""
+    name: str
+    completed_tasks: int = 0
+    pending_tasks: int = 0
+    next_steps: List[str] = field(default_factory=list)
+    blockers: List[str] = field(default_factory=list)
+
+
+@dataclass
+class Bottleneck:
+    """A detected bottleneck to surface in the briefing."""
+    severity: str  # 'high', 'medium', or 'low'
+    area: str
+    description: str
+
+
+@dataclass
+class Suggestion:
+    """A proactive suggestion to surface in the briefing."""
+    priority: str  # 'high', 'medium', or 'low'
+    title: str
+    description: str
+
+
+@dataclass
+class WeeklyAuditData:
+    """Audit data for the week the briefing covers."""
+    week_start: date
+    week_end: date
+    metrics: Optional[object] = None
+    partial: bool = False
+
+
+def _sorted_service_errors(metrics) -> List:
+    """
+    Sort a metrics object's errors_by_service into descending (service, count)
+    pairs, shared between bottleneck detection and suggestion generation.
+
+    Args:
+        metrics: AuditMetrics or None
+
+    Returns:
+        List of (service, count) tuples sorted by count descending
+    """
+    if not metrics:
+        return []
+    return sorted(metrics.errors_by_service.items(), key=lambda kv: -kv[1])
+
+
+def _count_md(dir_path: Path) -> int:
+    """
+    Count markdown files directly inside a directory with one directory read.
+
+    Args:
+        dir_path: Directory to count in
+
+    Returns:
+        Number of .md files, or 0 if the directory does not exist
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            return sum(1 for e in it if e.name.endswith('.md') and e.is_file(follow_symlinks=False))
+    except FileNotFoundError:
+        return 0
+
+
+class CEOBriefingGenerator:
+    """
+    Class to generate the Monday Morning CEO Briefing for the vault.
+    """
+
+    def __init__(self, vault_path: str):
+        """
+        Initialize the CEO briefing generator.
+
+        Args:
+            vault_path: Path to the Obsidian vault
+        """
+        self.vault_path = Path(vault_path)
+        self.logger = setup_logger("CEOBriefingGenerator", level=logging.INFO)
+
+    def gather_audit_data(self, week_end: date) -> WeeklyAuditData:
+        """
+        Collect weekly audit metrics for the briefing.
+
+        Args:
+            week_end: Last day of the week the briefing covers
+
+        Returns:
+            WeeklyAuditData with metrics populated when the audit generator
+            is available
+        """
+        week_start = week_end - timedelta(days=6)
+        audit_result = WeeklyAuditData(week_start=week_start, week_end=week_end)
+
+        if _AuditGenerator is None:
+            self.logger.warning("Audit generator not available; briefing will omit action metrics")
+            return audit_result
+
+        generator = _AuditGenerator(str(self.vault_path))
+        entries, partial = generator.parse_logs_for_week(week_end)
+        audit_result.metrics = generator.calculate_metrics(entries)
+        audit_result.partial = partial
+        return audit_result
+
+    def extract_project_statuses(self) -> List[ProjectStatus]:
+        """
+        Parse all plan documents in the vault into project statuses.
+
+        Returns:
+            List of ProjectStatus, one per parseable plan file
+        """
+        plans_dir = self.vault_path / "Plans"
+        projects: List[ProjectStatus] = []
+
+        try:
+            with os.scandir(plans_dir) as it:
+                files = sorted(
+                    ((e.path, e.stat().st_mtime_ns) for e in it if e.name.endswith('.md')),
+                )
+        except FileNotFoundError:
+            return projects
+
+        if not files:
+            return projects
+
+        # Unchanged files (same path and mtime) are served from the cache;
+        # only new or modified plans are read and re-parsed.
+        to_read = [(path, mtime_ns) for path, mtime_ns in files
+                   if _PLAN_CACHE.get(path, (None,))[0] != mtime_ns]
+
+        if to_read:
+            # The GIL is released during os.read, so a small thread pool
+            # overlaps the per-file open/read/close syscalls; parsing stays
+            # serial.
+            def _read(path: str):
+                return Path(path).read_text(encoding='utf-8')
+
+            with ThreadPoolExecutor(max_workers=min(16, len(to_read))) as executor:
+                futures = [(path, mtime_ns, executor.submit(_read, path))
+                           for path, mtime_ns in to_read]
+                for path, mtime_ns, future in futures:
+                    try:
+                        content = future.result()
+                        status = self._parse_plan_file(Path(path).stem, content)
+                        _PLAN_CACHE[path] = (mtime_ns, status)
+                    except Exception as e:
+                        self.logger.warning(f"Could not parse plan file: {e}")
+
+        # Drop cache entries for deleted plans so the cache tracks the vault
+        present = {path for path, _ in files}
+        for stale in [path for path in _PLAN_CACHE if path not in present]:
+            del _PLAN_CACHE[stale]
+
+        for path, _ in files:
+            cached = _PLAN_CACHE.get(path)
+            if cached is not None:
+                projects.append(cached[1])
+
+        return projects
+
+    def _parse_plan_file(self, stem: str, content: str) -> ProjectStatus:
+        """
+        Parse one plan document into a ProjectStatus.
+
+        Args:
+            stem: Filename stem used as fallback project name
+            content: Markdown content of the plan file
+
+        Returns:
+            ProjectStatus with task counts, next steps, and blockers
+        """
+        name = stem.replace('_', ' ').strip()
+        name_found = False
+
+        completed_boxes = 0
+        pending_boxes = 0
+        next_steps: List[str] = []
+        blockers: List[str] = []
+        in_blockers = False
+
+        # Single pass: headings, checkbox counts, next steps, and blockers are
+        # all collected in one scan of the file instead of five.
+        for line in content.splitlines():
+            if not name_found and line.startswith('# '):
+                name = line[2:].strip()
+                name_found = True
+                continue
+
+            s = line.lstrip()
+            if s.startswith(_CHECKED_PREFIXES):
+                completed_boxes += 1
+            elif s.startswith('- [ ]'):
+                pending_boxes += 1
+                if len(next_steps) < 3:
+                    step = s[5:].strip()
+                    if step:
+                        next_steps.append(step)
+
+            low = s.lower()
+            if low.startswith(_BLOCKER_PREFIXES) or \
+                    ('blocker' in low[:12] and _BLOCKER_HEADING_RE.match(s)):
+                in_blockers = True
+                continue
+            if in_blockers:
+                if line.startswith('#'):
+                    in_blockers = False
+                else:
+                    stripped = line.strip().lstrip('-* ').strip()
+                    if stripped and stripped not in ('None', 'N/A') and len(blockers) < 5:
+                        blockers.append(stripped)
+
+        return ProjectStatus(
+            name=name,
+            completed_tasks=completed_boxes,
+            pending_tasks=pending_boxes,
+            next_steps=next_steps,
+            blockers=blockers,
+        )
+
+    def _find_repeat_customers(self, audit_result: WeeklyAuditData) -> Dict[str, int]:
+        """
+        Find senders who emailed more than 3 times during the audited week.
+
+        Args:
+            audit_result: Audit data defining the week to scan
+
+        Returns:
+            Dictionary of email address to message count
+        """
+        log_dir = self.vault_path / "Logs"
+        sender_counts: Counter = Counter()
+
+        # ISO date filenames sort lexicographically, so one directory read
+        # plus string comparison selects the week's files without per-day
+        # stat/open attempts.
+        lo = audit_result.week_start.strftime('%Y-%m-%d.json')
+        hi = audit_result.week_end.strftime('%Y-%m-%d.json')
+        try:
+            with os.scandir(log_dir) as it:
+                files = sorted(e.path for e in it if e.name.endswith('.json') and lo <= e.name <= hi)
+        except FileNotFoundError:
+            files = []
+
+        for log_path in files:
+            try:
+                f = open(log_path, 'rb')
+            except IOError:
+                continue
+            with f:
+                for line in f:
+                    if _EMAIL_MARKER not in line:
+                        continue
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = _jloads(line)
+                    except ValueError:
+                        continue
+                    action = entry.get('action')
+                    if action not in _EMAIL_ACTIONS:
+                        continue
+                    params = entry.get('parameters') or {}
+                    sender = params.get('from') or params.get('sender')
+                    if not sender:
+                        continue
+                    match = _EMAIL_RE.search(str(sender))
+                    if match:
+                        email = match.group(0).lower()
+                        sender_counts[email] += 1
+
+        return {k: v for k, v in sender_counts.items() if v > 3}
+
+    def detect_bottlenecks(self, audit_result: WeeklyAuditData,
+                           projects: List[ProjectStatus],
+                           errs_sorted: Optional[List] = None,
+                           pending_count: Optional[int] = None) -> List[Bottleneck]:
+        """
+        Detect operational bottlenecks from vault state and audit metrics.
+
+        Args:
+            audit_result: Weekly audit data
+            projects: Parsed project statuses
+            errs_sorted: Optional pre-sorted (service, count) error pairs,
+                descending by count, shared with generate_suggestions
+            pending_count: Optional pre-computed Pending_Approval count so the
+                directory is only scanned once per briefing
+
+        Returns:
+            List of bottlenecks sorted by severity
+        """
+        bottlenecks: List[Bottleneck] = []
+
+        if pending_count is None:
+            pending_count = _count_md(self.vault_path / "Pending_Approval")
+        if pending_count > 10:
+            bottlenecks.append(Bottleneck(
+                'high', 'Approvals',
+                f"{pending_count} items are waiting in Pending_Approval"))
+        elif pending_count > 5:
+            bottlenecks.append(Bottleneck(
+                'medium', 'Approvals',
+                f"{pending_count} items are waiting in Pending_Approval"))
+
+        if errs_sorted is None:
+            errs_sorted = _sorted_service_errors(audit_result.metrics)
+        for service, count in errs_sorted:
+            if count <= 10:
+                break  # Descending order: nothing further can qualify
+            bottlenecks.append(Bottleneck(
+                'high', service,
+                f"{count} errors recorded for {service} this week"))
+
+        for project in projects:
+            if project.blockers:
+                bottlenecks.append(Bottleneck(
+                    'medium', project.name,
+                    f"Blocked: {'; '.join(project.blockers[:2])}"))
+
+        bottlenecks.sort(key=lambda b: _SEVERITY_ORDER.get(b.severity, 3))
+        return bottlenecks
+
+    def generate_suggestions(self, audit_result: WeeklyAuditData,
+                             repeat_customers: Dict[str, int],
+                             errs_sorted: Optional[List] = None,
+                             needs_action_count: Optional[int] = None) -> List[Suggestion]:
+        """
+        Generate proactive suggestions from audit metrics and vault activity.
+
+        Args:
+            audit_result: Weekly audit data
+            repeat_customers: Output of _find_repeat_customers
+            errs_sorted: Optional pre-sorted (service, count) error pairs,
+                descending by count, shared with detect_bottlenecks
+            needs_action_count: Optional pre-computed Needs_Action count so
+                the directory is only scanned once per briefing
+
+        Returns:
+            List of suggestions sorted by priority
+        """
+        suggestions: List[Suggestion] = []
+
+        if errs_sorted is None:
+            errs_sorted = _sorted_service_errors(audit_result.metrics)
+        for service, count in errs_sorted:
+            if count <= 5:
+                break  # Descending order: nothing further can qualify
+            priority = 'high' if count > 10 else 'medium'
+            suggestions.append(Suggestion(
+                priority, f"Review {service} integration",
+                f"{count} failures recorded this week; check credentials and rate limits."))
+
+        for email, count in repeat_customers.items():
+            suggestions.append(Suggestion(
+                'medium', f"Frequent contact: {email}",
+                f"Received {count} emails this week; consider a dedicated follow-up."))
+
+        if needs_action_count is None:
+            needs_action_count = _count_md(self.vault_path / "Needs_Action")
+        if needs_action_count > 10:
+            suggestions.append(Suggestion(
+                'high', "Clear the Needs_Action backlog",
+                f"{needs_action_count} items are waiting for triage."))
+
+        suggestions.sort(key=lambda s: _PRIORITY_ORDER.get(s.priority, 3))
+        return suggestions
+
+    def generate_briefing_markdown(self, audit_result: WeeklyAuditData,
+                                   projects: List[ProjectStatus],
+                                   bottlenecks: List[Bottleneck],
+                                   suggestions: List[Suggestion],
+                                   approvals_pending: int,
+                                   needs_action: int,
+                                   week_end_iso: Optional[str] = None) -> str:
+        """
+        Create the markdown content for the CEO briefing.
+
+        Args:
+            audit_result: Weekly audit data
+            projects: Parsed project statuses
+            bottlenecks: Detected bottlenecks
+            suggestions: Generated suggestions
+            approvals_pending: Count of files in Pending_Approval
+            needs_action: Count of files in Needs_Action
+            week_end_iso: Optional pre-formatted week_end date to avoid a
+                redundant strftime in the caller/callee pair
+
+        Returns:
+            Markdown content string
+        """
+        week_end = audit_result.week_end
+
+        # Format each timestamp exactly once
+        now_s = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+        if week_end_iso is None:
+            week_end_iso = week_end.strftime('%Y-%m-%d')
+        week_start_iso = audit_result.week_start.strftime('%Y-%m-%d')
+        week_end_long = week_end.strftime('%A, %B %d %Y')
+
+        # Sections are accumulated as list parts and joined once; repeated
+        # str += is quadratic for briefings with many entries.
+        parts: List[str] = []
+        for b in bottlenecks:
+            emoji = _SEVERITY_EMOJI.get(b.severity, '⚪')
+            parts.append(f"\n### {emoji} {b.severity.upper()} - {b.area}\n{b.description}\n")
+        bottleneck_section = ''.join(parts) if parts else "\n_No bottlenecks detected this week._\n"
+
+        parts = []
+        for s in suggestions:
+            emoji = _PRIORITY_EMOJI.get(s.priority, '⚪')
+            parts.append(f"\n### {emoji} {s.title}\n{s.description}\n")
+        suggestion_section = ''.join(parts) if parts else "\n_No suggestions this week._\n"
+
+        parts = []
+        for project in projects:
+            total = project.completed_tasks + project.pending_tasks
+            parts.append(f"\n### {project.name}\n")
+            parts.append(f"- **Progress**: {project.completed_tasks}/{total} tasks completed\n")
+            for step in project.next_steps:
+                parts.append(f"- Next: {step}\n")
+            for blocker in project.blockers:
+                parts.append(f"- ⚠️ Blocker: {blocker}\n")
+        project_section = ''.join(parts) if parts else "\n_No active plans found._\n"
+
+        metrics = audit_result.metrics
+        total_actions = metrics.total_actions if metrics else 0
+        failed_actions = metrics.failed_actions if metrics else 0
+
+        markdown = f"""---
+generated: {now_s}
+period: {week_start_iso} to {week_end_iso}
+---
+
+# Monday Morning CEO Briefing
+
+**Week ending {week_end_long}**
+
+## Executive Summary
+- **Actions taken**: {total_actions}
+- **Failures**: {failed_actions}
+- **Approvals pending**: {approvals_pending}
+- **Items needing action**: {needs_action}
+
+## Projects
+{project_section}
+
+## Bottlenecks
+{bottleneck_section}
+
+## Proactive Suggestions
+{suggestion_section}
+
+---
+*Generated by AI Employee v0.1*
+"""
+        return markdown
+
+    def generate_ceo_briefing(self, week_end: Optional[date] = None) -> Optional[Path]:
+        """
+        Generate the CEO briefing and save it to the vault.
+
+        Args:
+            week_end: Last day of the week to cover (default: today)
+
+        Returns:
+            Path to the created briefing file, or None on failure
+        """
+        start_ns = time.perf_counter_ns()
+
+        if week_end is None:
+            week_end = date.today()
+
+        try:
+            if not self.vault_path.is_dir():
+                # Fast path: without a vault every helper would just probe the
+                # filesystem and come back empty, so skip straight to an
+                # empty briefing.
+                self.logger.warning(f"Vault path {self.vault_path} does not exist; generating empty briefing")
+                audit_result = WeeklyAuditData(week_start=week_end - timedelta(days=6), week_end=week_end)
+                projects: List[ProjectStatus] = []
+                bottlenecks: List[Bottleneck] = []
+                suggestions: List[Suggestion] = []
+                approvals_pending = needs_action = 0
+            else:
+                audit_result = self.gather_audit_data(week_end)
+                projects = self.extract_project_statuses()
+
+                # Each vault directory is counted once and shared between the
+                # summary and the detection helpers
+                approvals_pending = _count_md(self.vault_path / "Pending_Approval")
+                needs_action = _count_md(self.vault_path / "Needs_Action")
+
+                errs_sorted = _sorted_service_errors(audit_result.metrics)
+                bottlenecks = self.detect_bottlenecks(
+                    audit_result, projects, errs_sorted, pending_count=approvals_pending)
+                repeat_customers = self._find_repeat_customers(audit_result)
+                suggestions = self.generate_suggestions(
+                    audit_result, repeat_customers, errs_sorted,
+                    needs_action_count=needs_action)
+
+            week_end_iso = week_end.strftime('%Y-%m-%d')
+            markdown = self.generate_briefing_markdown(
+                audit_result, projects, bottlenecks, suggestions,
+                approvals_pending, needs_action, week_end_iso=week_end_iso)
+
+            output_dir = self.vault_path / "Briefings"
+            output_dir.mkdir(parents=True, exist_ok=True)
+            briefing_file = output_dir / f"{week_end_iso}-briefing.md"
+            # Encode once and write bytes directly, skipping the TextIOWrapper
+            # layer write_text would add around the same single write
+            briefing_file.write_bytes(markdown.encode('utf-8'))
+
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            # SC-001: the briefing must be produced within the 10-minute budget
+            if duration_ms > 600_000:
+                self.logger.warning(f"Briefing generation exceeded SC-001 budget: {duration_ms}ms")
+
+            self._log_briefing_generation(duration_ms, len(bottlenecks), len(suggestions))
+            self.logger.info(f"Generated CEO briefing: {briefing_file} ({duration_ms}ms)")
+            return briefing_file
+
+        except Exception as e:
+            self.logger.error(f"Error generating CEO briefing: {e}")
+            return None
+
+    def _log_briefing_generation(self, duration_ms: int, bottleneck_count: int,
+                                 suggestion_count: int):
+        """
+        Record the briefing generation in the structured action log.
+
+        Args:
+            duration_ms: Time taken to generate the briefing in milliseconds
+            bottleneck_count: Number of bottlenecks surfaced
+            suggestion_count: Number of suggestions surfaced
+        """
+        if _log_action is None:
+            return
+
+        _log_action(
+            str(self.vault_path),
+            action='ceo_briefing_generated',
+            actor='ceo_briefing_generator',
+            service='briefing',
+            parameters={
+                'duration_ms': duration_ms,
+                'bottlenecks': bottleneck_count,
+                'suggestions': suggestion_count,
+            },
+            logger=self.logger,
+        )
+
+
+def get_ceo_briefing_generator(vault_path: str) -> CEOBriefingGenerator:
+    """
+    Get a CEOBriefingGenerator instance for the specified vault.
+
+    Args:
+        vault_path: Path to the Obsidian vault
+
+    Returns:
+        CEOBriefingGenerator instance
+    """
+    return CEOBriefingGenerator(vault_path)
+
+
+if __name__ == "__main__":
+    # Example usage
+    import logging
+
+    # Set up logging
+    logging.basicConfig(level=logging.INFO)
+
+    # Create a CEO briefing generator
+    generator = CEOBriefingGenerator("./test_vault")
+
+    # Generate the briefing
+    briefing_path = generator.generate_ceo_briefing()
+    print(f"CEO briefing: {briefing_path}")
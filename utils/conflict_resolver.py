@@ -3,21 +3,161 @@ Conflict Resolution Module for the Personal AI Employee system.
 Handles detection and resolution of duplicate action items across different channels.
 """
 
+import atexit
 import hashlib
 import json
 import logging
+import mmap
+import os
+import re
+import threading
 import time
+from collections import OrderedDict, deque
 from datetime import datetime, timedelta
+from difflib import SequenceMatcher
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from utils.setup_logger import setup_logger
 
+# rapidfuzz's C-backed ratio with score_cutoff short-circuiting is orders of
+# magnitude faster than pure Python; fall back to difflib when not installed.
+try:
+    from rapidfuzz.fuzz import ratio as _fuzz_ratio
+except ImportError:
+    _fuzz_ratio = None
+
+# orjson serializes the journal records several times faster than stdlib
+# json; the stdlib path is kept as a fallback.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# Bloom-filter front-end for the membership test; a plain set stands in when
+# pybloom_live is not installed (exact, still one cache-friendly probe).
+try:
+    from pybloom_live import ScalableBloomFilter as _BloomFilter
+except ImportError:
+    _BloomFilter = None
+
+# Minimum similarity (0-100) for two key contents to count as near-duplicates
+_NEAR_DUPLICATE_CUTOFF = 85
+
+
+def _similarity(a: str, b: str) -> float:
+    """
+    Score the similarity of two key-content strings on a 0-100 scale.
+
+    Args:
+        a: First key content string
+        b: Second key content string
+
+    Returns:
+        Similarity score; with rapidfuzz, scores below the cutoff return 0
+    """
+    if _fuzz_ratio is not None:
+        return _fuzz_ratio(a, b, score_cutoff=_NEAR_DUPLICATE_CUTOFF)
+    return SequenceMatcher(None, a, b).ratio() * 100
+
+
+# Whitespace runs collapsed during key-content normalization
+_WS_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=4096)
+def _hash_key_content(key_content: str) -> str:
+    """
+    Hash key content; cached so identical payloads seen across batches skip
+    the hashing entirely. Extraction already normalizes case and whitespace,
+    so this is a single encode plus hash.
+
+    Args:
+        key_content: Extracted, normalized key content to hash
+
+    Returns:
+        Hex digest of the content
+    """
+    # The hash is only a dict key for duplicate detection, so the cheaper
+    # BLAKE2b with a 128-bit digest replaces the cryptographic SHA-256
+    return hashlib.blake2b(key_content.encode('utf-8'), digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=2048)
+def _extract_key_content_cached(content: str) -> str:
+    """
+    Extract key content from action file content, memoized so callers that
+    re-scan the same vault files skip the regex pass on repeat inputs.
+
+    Args:
+        content: Full content of the action file
+
+    Returns:
+        Key content for comparison
+    """
+    # Remove frontmatter if present; a string-level find avoids both the
+    # regex machinery and allocating a per-line list just to locate '---'
+    if content.startswith('---\n'):
+        end = content.find('\n---\n', 4)
+        if end != -1:
+            content = content[end + 5:]
+
+    # One compiled-regex pass picks out list items, key-value pairs, and
+    # long body lines, skipping the per-line Python classifier loop
+    # Normalize here (lowercase, collapsed whitespace) so hashing does not
+    # have to re-normalize the same string
+    joined = ' '.join(
+        m.group(0).strip() for m in ConflictResolver._KEY_LINE_RE.finditer(content)
+        if not m.group(0).lstrip().startswith(('# ', '## '))
+    )
+    return _WS_RE.sub(' ', joined).lower()
+
+
+# Per-file content hashes keyed by (mtime_ns, size) so repeated scans of an
+# unchanged file skip the read, extraction, and hashing entirely
+_FILE_HASH_CACHE: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+
+def get_file_hash(file_path) -> Optional[str]:
+    """
+    Get the duplicate-detection content hash for a file on disk.
+
+    Args:
+        file_path: Path to the file to hash
+
+    Returns:
+        Content hash string, or None if the file cannot be read
+    """
+    path_key = str(file_path)
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+
+    stat_key = (st.st_mtime_ns, st.st_size)
+    cached = _FILE_HASH_CACHE.get(path_key)
+    if cached is not None and cached[0] == stat_key:
+        return cached[1]
+
+    try:
+        content = Path(file_path).read_text(encoding='utf-8')
+    except (IOError, UnicodeDecodeError):
+        return None
+
+    content_hash = _hash_key_content(_extract_key_content_cached(content))
+    _FILE_HASH_CACHE[path_key] = (stat_key, content_hash)
+    return content_hash
+
 
 class ConflictResolver:
     """
     Class to handle conflict resolution for duplicate action items across channels.
     """
 
+    # Lines that carry comparison-relevant content: list items, key-value
+    # pairs (but not bare URLs), or long body lines
+    _KEY_LINE_RE = re.compile(r'^(?:[-*] .+|(?!https?:)[^:\n]+:.+|.{21,})$', re.MULTILINE)
+
     def __init__(self, vault_path: str):
         """
         Initialize the conflict resolver.
@@ -32,36 +172,155 @@ class ConflictResolver:
         self.conflict_tracking_dir = self.vault_path / ".tracking"
         self.conflict_tracking_dir.mkdir(exist_ok=True)
 
-        # File to store duplicate tracking
+        # Compacted snapshot plus an append-only journal of new records, so
+        # registering one item costs one appended line instead of a full
+        # rewrite of the tracker
         self.duplicate_tracker_file = self.conflict_tracking_dir / "duplicate_tracker.json"
-
-        # Load existing duplicate tracker
-        self.duplicate_tracker = self._load_duplicate_tracker()
+        self.journal_file = self.conflict_tracking_dir / "duplicate_tracker.jsonl"
+
+        # The tracker itself is loaded lazily on first access (see the
+        # duplicate_tracker cached_property), so processes that never touch
+        # duplicate detection skip the startup read and parse entirely
+
+        # Journal records appended since the last compaction
+        self._dirty = 0
+        self._compact_threshold = 500
+
+        # Records registered but not yet written to the journal; flushed in
+        # one writelines call at batch boundaries or when the buffer fills
+        self._pending: List[Dict] = []
+        self._pending_limit = 64
+        atexit.register(self.flush)
+
+        # Recent (key_content, content_hash) pairs for the fuzzy near-
+        # duplicate pass; bounded so the scan stays O(1) amortized
+        self._recent_keys = deque(maxlen=200)
+
+        # LRU of duplicate-check results keyed by raw (content, channel), so
+        # callers re-scanning the same files skip the whole pipeline;
+        # invalidated whenever a new item is registered
+        self._input_cache: OrderedDict = OrderedDict()
+        self._input_cache_limit = 512
+
+    @cached_property
+    def duplicate_tracker(self) -> Dict:
+        """Duplicate tracker dictionary, loaded from disk on first access."""
+        return self._load_duplicate_tracker()
+
+    @cached_property
+    def _bloom(self):
+        """Membership prefilter seeded from the tracker keys on first use."""
+        if _BloomFilter is not None:
+            bloom = _BloomFilter(initial_capacity=10000, error_rate=0.001)
+            for content_hash in self.duplicate_tracker:
+                bloom.add(content_hash)
+            return bloom
+        return set(self.duplicate_tracker)
 
     def _load_duplicate_tracker(self) -> Dict:
         """
-        Load the duplicate tracker from file.
+        Load the duplicate tracker from the snapshot plus journal.
 
         Returns:
             Dictionary containing duplicate tracking information
         """
+        tracker: Dict = {}
+
         if self.duplicate_tracker_file.exists():
             try:
-                with open(self.duplicate_tracker_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
+                # Parse straight out of the page cache via mmap; orjson
+                # accepts the memoryview without copying, while stdlib json
+                # needs one bytes copy (no worse than a plain read)
+                with open(self.duplicate_tracker_file, 'rb') as f:
+                    size = os.fstat(f.fileno()).st_size
+                    if size:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                            if _orjson is not None:
+                                tracker = _orjson.loads(memoryview(m))
+                            else:
+                                tracker = json.loads(bytes(m))
+            except (json.JSONDecodeError, ValueError, IOError):
                 self.logger.warning(f"Could not load duplicate tracker from {self.duplicate_tracker_file}")
-                return {}
-        return {}
+                tracker = {}
+
+        # Fold journaled records (appended since the last compaction) on top
+        if self.journal_file.exists():
+            try:
+                with open(self.journal_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            record = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue  # Skip partially-written lines
+                        content_hash = record.get('content_hash')
+                        if content_hash:
+                            tracker[content_hash] = record
+            except IOError:
+                self.logger.warning(f"Could not read duplicate tracker journal {self.journal_file}")
+
+        return tracker
+
+    def _append_record(self, record: Dict):
+        """
+        Buffer one record for the duplicate tracker journal.
+
+        Args:
+            record: Record dictionary to journal
+        """
+        self._pending.append(record)
+        if len(self._pending) >= self._pending_limit:
+            self.flush()
 
-    def _save_duplicate_tracker(self):
-        """Save the duplicate tracker to file."""
+    def _compact(self):
+        """Rewrite the consolidated tracker snapshot and truncate the journal."""
         try:
-            with open(self.duplicate_tracker_file, 'w', encoding='utf-8') as f:
-                json.dump(self.duplicate_tracker, f, indent=2, default=str)
+            # Write to a temp file and rename into place; the rename is
+            # atomic on POSIX, so a crash mid-compaction leaves the previous
+            # snapshot intact instead of a truncated file (and no per-save
+            # fsync is needed). The snapshot is machine-read only; compact
+            # separators roughly third the output size versus pretty-printing
+            tmp_file = self.duplicate_tracker_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.duplicate_tracker, f, separators=(',', ':'), default=str)
+            os.replace(tmp_file, self.duplicate_tracker_file)
+            self.journal_file.unlink(missing_ok=True)
+            # Buffered records are already in the snapshot via the tracker
+            self._pending.clear()
+            self._dirty = 0
         except IOError as e:
             self.logger.error(f"Could not save duplicate tracker: {e}")
 
+    def flush(self):
+        """Write buffered records to the journal, compacting when due."""
+        if not self._pending:
+            return
+        try:
+            if _orjson is not None:
+                with open(self.journal_file, 'ab', buffering=1 << 16) as f:
+                    f.writelines(_orjson.dumps(record, default=str) + b'\n'
+                                 for record in self._pending)
+            else:
+                with open(self.journal_file, 'a', encoding='utf-8', buffering=1 << 16) as f:
+                    f.writelines(json.dumps(record, default=str) + '\n'
+                                 for record in self._pending)
+            self._dirty += len(self._pending)
+            self._pending.clear()
+            if self._dirty >= self._compact_threshold:
+                self._compact()
+        except IOError as e:
+            self.logger.error(f"Could not append to duplicate tracker journal: {e}")
+
+    def __del__(self):
+        try:
+            self.flush()
+            if self._dirty:
+                self._compact()
+        except Exception:
+            pass  # Interpreter may be shutting down
+
     def _generate_content_hash(self, content: str) -> str:
         """
         Generate a hash of the content for comparison purposes.
@@ -72,9 +331,7 @@ class ConflictResolver:
         Returns:
             Hash of the content
         """
-        # Normalize content by removing whitespace and converting to lowercase
-        normalized = ' '.join(content.lower().split())
-        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+        return _hash_key_content(content)
 
     def _extract_key_content(self, content: str) -> str:
         """
@@ -86,37 +343,11 @@ class ConflictResolver:
         Returns:
             Key content for comparison
         """
-        # Remove frontmatter if present
-        lines = content.split('\n')
-        if lines and lines[0].strip() == '---':
-            # Look for the end of frontmatter
-            try:
-                end_fm_idx = lines.index('---', 1)
-                content = '\n'.join(lines[end_fm_idx + 1:])
-            except ValueError:
-                pass  # No closing frontmatter
-
-        # Extract key sections for comparison
-        key_parts = []
-
-        # Look for common sections in action files
-        for line in content.split('\n'):
-            line = line.strip()
-            if line.startswith('# ') or line.startswith('## '):
-                # Skip heading lines
-                continue
-            elif line.startswith('- ') or line.startswith('* '):
-                # Include list items (action items)
-                key_parts.append(line)
-            elif ':' in line and not line.startswith('http'):
-                # Include key-value pairs like sender information
-                key_parts.append(line)
-            elif len(line) > 20:  # Likely body content
-                key_parts.append(line)
-
-        return ' '.join(key_parts)
-
-    def is_duplicate_action_item(self, content: str, channel: str, sender_id: str = None) -> Tuple[bool, Optional[str]]:
+        return _extract_key_content_cached(content)
+
+    def is_duplicate_action_item(self, content: str, channel: str, sender_id: str = None,
+                                 content_hash: str = None,
+                                 _now: float = None) -> Tuple[bool, Optional[str]]:
         """
         Check if an action item is a duplicate of an existing one.
 
@@ -124,35 +355,69 @@ class ConflictResolver:
             content: Content of the action item
             channel: Channel where the action item originated (e.g., 'gmail', 'whatsapp')
             sender_id: Optional ID of the sender for additional context
+            content_hash: Optional pre-computed content hash so batch callers
+                do not re-extract and re-hash the same content
+            _now: Optional epoch seconds so batch callers read the clock once
 
         Returns:
             Tuple of (is_duplicate, existing_file_path) where is_duplicate is a boolean
             and existing_file_path is the path to the existing duplicate file (or None)
         """
-        # Extract key content for comparison
-        key_content = self._extract_key_content(content)
-        content_hash = self._generate_content_hash(key_content)
-
-        # Check if we've seen this content hash before
-        for existing_hash, record in self.duplicate_tracker.items():
-            if existing_hash == content_hash:
-                # Same content, check if it's from the same or different channel
-                existing_channel = record.get('channel', 'unknown')
-
-                # If it's from the same channel, it's definitely a duplicate
-                # If it's from a different channel but same content, it's likely a duplicate
-                if existing_channel == channel or self._is_cross_channel_duplicate(record, {'channel': channel, 'sender_id': sender_id}):
-                    return True, record.get('file_path')
-
-        return False, None
+        # Identical raw content is checked repeatedly by callers re-scanning
+        # the same files; a small LRU short-circuits the whole pipeline
+        cache_key = (content, channel)
+        cached = self._input_cache.get(cache_key)
+        if cached is not None:
+            self._input_cache.move_to_end(cache_key)
+            return cached
+
+        result = (False, None)
+
+        key_content = None
+        if content_hash is None:
+            # Extract key content for comparison
+            key_content = self._extract_key_content(content)
+            content_hash = self._generate_content_hash(key_content)
 
-    def _is_cross_channel_duplicate(self, existing_record: Dict, new_record: Dict) -> bool:
+        # Cheap membership prefilter; only a positive probe pays for the
+        # full record lookup (false positives just fall through to it)
+        record = None
+        if content_hash in self._bloom:
+            record = self.duplicate_tracker.get(content_hash)
+        if record is None:
+            # Exact hash miss: look for near-duplicates (typos, emoji,
+            # trailing punctuation) among recently registered items
+            if key_content is None:
+                key_content = self._extract_key_content(content)
+            for recent_key, recent_hash in self._recent_keys:
+                if _similarity(key_content, recent_key) >= _NEAR_DUPLICATE_CUTOFF:
+                    record = self.duplicate_tracker.get(recent_hash)
+                    break
+
+        if record is not None:
+            # Same content, check if it's from the same or different channel
+            existing_channel = record.get('channel', 'unknown')
+
+            # If it's from the same channel, it's definitely a duplicate
+            # If it's from a different channel but same content, it's likely a duplicate
+            if existing_channel == channel or self._is_cross_channel_duplicate(
+                    record, {'channel': channel, 'sender_id': sender_id}, _now=_now):
+                result = (True, record.get('file_path'))
+
+        self._input_cache[cache_key] = result
+        if len(self._input_cache) > self._input_cache_limit:
+            self._input_cache.popitem(last=False)
+        return result
+
+    def _is_cross_channel_duplicate(self, existing_record: Dict, new_record: Dict,
+                                    _now: float = None) -> bool:
         """
         Determine if a record from one channel is a duplicate of a record from another channel.
 
         Args:
             existing_record: Existing record information
             new_record: New record information
+            _now: Optional epoch seconds so batch callers read the clock once
 
         Returns:
             True if records are considered duplicates, False otherwise
@@ -166,21 +431,28 @@ class ConflictResolver:
 
         # For cross-channel duplicates, we're more lenient
         # Consider it a duplicate if it's the same content within a reasonable timeframe
+        # Records carry epoch seconds so this is one float subtraction
+        existing_epoch = existing_record.get('timestamp_epoch')
+        if existing_epoch is not None:
+            # If the same content appeared in different channels within 10 minutes, consider it a duplicate
+            if _now is None:
+                _now = time.time()
+            return abs(_now - existing_epoch) < 600
+
+        # Legacy records only have the ISO timestamp string
         existing_timestamp = existing_record.get('timestamp')
         if existing_timestamp:
             try:
                 existing_dt = datetime.fromisoformat(existing_timestamp.replace('Z', '+00:00'))
-                time_diff = abs((datetime.now() - existing_dt).total_seconds())
-
-                # If the same content appeared in different channels within 10 minutes, consider it a duplicate
-                return time_diff < 600  # 10 minutes in seconds
+                return abs((datetime.now() - existing_dt).total_seconds()) < 600
             except ValueError:
                 # If timestamp parsing fails, assume it's not a duplicate
                 pass
 
         return False
 
-    def register_action_item(self, content: str, file_path: str, channel: str, sender_id: str = None) -> bool:
+    def register_action_item(self, content: str, file_path: str, channel: str, sender_id: str = None,
+                             content_hash: str = None) -> bool:
         """
         Register a new action item to track for potential duplicates.
 
@@ -189,29 +461,43 @@ class ConflictResolver:
             file_path: Path where the action item file is stored
             channel: Channel where the action item originated
             sender_id: Optional ID of the sender
+            content_hash: Optional pre-computed content hash so batch callers
+                do not re-extract and re-hash the same content
 
         Returns:
             True if successfully registered, False otherwise
         """
         try:
-            # Extract key content for comparison
-            key_content = self._extract_key_content(content)
-            content_hash = self._generate_content_hash(key_content)
-
-            # Create record for this action item
+            key_content = None
+            if content_hash is None:
+                # Extract key content for comparison
+                key_content = self._extract_key_content(content)
+                content_hash = self._generate_content_hash(key_content)
+
+            # Create record for this action item; the epoch field lets age
+            # checks compare floats instead of parsing the ISO string
+            now = datetime.now()
             record = {
                 'file_path': file_path,
                 'channel': channel,
                 'sender_id': sender_id,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now.isoformat(),
+                'timestamp_epoch': now.timestamp(),
                 'content_hash': content_hash
             }
 
-            # Add to duplicate tracker
+            # Add to duplicate tracker and journal the new record
             self.duplicate_tracker[content_hash] = record
+            self._bloom.add(content_hash)
+            self._append_record(record)
+
+            # Cached negatives may now be duplicates of this item
+            self._input_cache.clear()
 
-            # Save the updated tracker
-            self._save_duplicate_tracker()
+            # Remember the key content for the fuzzy near-duplicate pass
+            if key_content is None:
+                key_content = self._extract_key_content(content)
+            self._recent_keys.append((key_content, content_hash))
 
             self.logger.debug(f"Registered action item: {file_path} (hash: {content_hash[:8]})")
             return True
@@ -233,17 +519,21 @@ class ConflictResolver:
         unique_items = []
         processed_hashes = set()
 
+        # One clock read shared by every cross-channel window check
+        now_epoch = time.time()
+
         for item in action_items:
             content = item.get('content', '')
             channel = item.get('channel', 'unknown')
             sender_id = item.get('sender_id')
 
-            # Extract key content for comparison
+            # Extract and hash key content once; the helpers reuse the hash
             key_content = self._extract_key_content(content)
             content_hash = self._generate_content_hash(key_content)
 
             # Check if this is a duplicate
-            is_duplicate, existing_path = self.is_duplicate_action_item(content, channel, sender_id)
+            is_duplicate, existing_path = self.is_duplicate_action_item(
+                content, channel, sender_id, content_hash=content_hash, _now=now_epoch)
 
             if not is_duplicate and content_hash not in processed_hashes:
                 # This is a unique item, add it to the list
@@ -251,10 +541,12 @@ class ConflictResolver:
                 processed_hashes.add(content_hash)
 
                 # Register it so future duplicates can be detected
-                self.register_action_item(content, item.get('file_path', 'unknown'), channel, sender_id)
+                self.register_action_item(content, item.get('file_path', 'unknown'), channel, sender_id,
+                                          content_hash=content_hash)
             else:
                 self.logger.info(f"Skipping duplicate action item from {channel} (similar to {existing_path or 'existing item'})")
 
+        self.flush()
         return unique_items
 
     def cleanup_old_records(self, days_to_keep: int = 30):
@@ -265,10 +557,19 @@ class ConflictResolver:
             days_to_keep: Number of days to keep records (default: 30)
         """
         try:
+            cutoff_epoch = time.time() - days_to_keep * 86400
             cutoff_time = datetime.now() - timedelta(days=days_to_keep)
             old_hashes = []
 
             for content_hash, record in self.duplicate_tracker.items():
+                record_epoch = record.get('timestamp_epoch')
+                if record_epoch is not None:
+                    # Numeric comparison, no per-record date parsing
+                    if record_epoch < cutoff_epoch:
+                        old_hashes.append(content_hash)
+                    continue
+
+                # Legacy records only have the ISO timestamp string
                 timestamp_str = record.get('timestamp')
                 if timestamp_str:
                     try:
@@ -285,19 +586,25 @@ class ConflictResolver:
 
             if old_hashes:
                 self.logger.info(f"Cleaned up {len(old_hashes)} old duplicate tracking records")
-                self._save_duplicate_tracker()
+                # Compact so removed records do not resurface from the journal
+                self._compact()
+                # Cached duplicate verdicts may point at the purged
+                # records; drop them so cleanup takes effect immediately
+                self._input_cache.clear()
 
         except Exception as e:
             self.logger.error(f"Error cleaning up old duplicate records: {e}")
 
 
-# Global instance for easy access
-_resolver_instance = None
+# One resolver per vault, guarded by a lock so concurrent callers neither
+# race the construction nor tear down another vault's in-memory tracker
+_resolvers: Dict[str, ConflictResolver] = {}
+_resolvers_lock = threading.Lock()
 
 
 def get_conflict_resolver(vault_path: str) -> ConflictResolver:
     """
-    Get a singleton instance of the conflict resolver for the given vault path.
+    Get the shared conflict resolver instance for the given vault path.
 
     Args:
         vault_path: Path to the Obsidian vault
@@ -305,10 +612,12 @@ def get_conflict_resolver(vault_path: str) -> ConflictResolver:
     Returns:
         ConflictResolver instance
     """
-    global _resolver_instance
-    if _resolver_instance is None or str(_resolver_instance.vault_path) != str(vault_path):
-        _resolver_instance = ConflictResolver(vault_path)
-    return _resolver_instance
+    key = str(Path(vault_path).resolve())
+    with _resolvers_lock:
+        instance = _resolvers.get(key)
+        if instance is None:
+            instance = _resolvers[key] = ConflictResolver(vault_path)
+        return instance
 
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ Provides functions for reading/writing markdown files in the Obsidian vault.
 
 import os
 import json
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
@@ -39,12 +40,17 @@ def write_markdown_file(file_path: str, content: str, append: bool = False):
         append: Whether to append to the file or overwrite (default: False)
     """
     path = Path(file_path)
-    mode = 'a' if append else 'w'
 
     # Create parent directories if they don't exist
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(path, mode, encoding='utf-8') as f:
+    if not append:
+        # Whole-file overwrite is the common case: one buffered write
+        path.write_text(content, encoding='utf-8')
+        return
+
+    # Appends use a 1 MiB buffer so large documents land in few syscalls
+    with open(path, 'a', encoding='utf-8', buffering=1 << 20) as f:
         f.write(content)
 
 
@@ -71,18 +77,21 @@ def create_action_file(
     filename = f"{safe_prefix}_{timestamp}.md"
     file_path = Path(base_path) / filename
 
-    full_content = ""
+    # Build the document as a list of parts and join once, so growing the
+    # string does not re-copy it for every appended piece
+    parts = []
     if frontmatter:
         # Add YAML frontmatter
-        full_content += "---\n"
+        parts.append("---\n")
         for key, value in frontmatter.items():
             if isinstance(value, str):
-                full_content += f"{key}: \"{value}\"\n"
+                parts.append(f"{key}: \"{value}\"\n")
             else:
-                full_content += f"{key}: {json.dumps(value) if isinstance(value, (list, dict)) else value}\n"
-        full_content += "---\n\n"
+                parts.append(f"{key}: {json.dumps(value) if isinstance(value, (list, dict)) else value}\n")
+        parts.append("---\n\n")
 
-    full_content += content
+    parts.append(content)
+    full_content = ''.join(parts)
 
     write_markdown_file(file_path, full_content)
     return file_path
@@ -120,16 +129,19 @@ def create_approval_request(
         "expires": expiry_time.isoformat(),  # Expires in 24 hours
     }
 
-    content = f"# {title}\n\n"
-    content += f"## Action Details\n"
-    content += f"**Action Type:** {action_type}\n\n"
-    content += f"**Request Data:**\n"
+    lines = [
+        f"# {title}\n\n",
+        "## Action Details\n",
+        f"**Action Type:** {action_type}\n\n",
+        "**Request Data:**\n",
+    ]
     for key, value in request_data.items():
-        content += f"- **{key}:** {value}\n"
-    content += "\n"
-    content += f"## Instructions\n"
-    content += f"- Move this file to `/Approved` to approve the action\n"
-    content += f"- Move this file to `/Rejected` to reject the action\n\n"
+        lines.append(f"- **{key}:** {value}\n")
+    lines.append("\n")
+    lines.append("## Instructions\n")
+    lines.append("- Move this file to `/Approved` to approve the action\n")
+    lines.append("- Move this file to `/Rejected` to reject the action\n\n")
+    content = ''.join(lines)
 
     return create_action_file(
         str(approval_path),
@@ -169,15 +181,16 @@ def create_plan_document(
         "completed_tasks": 0,
     }
 
-    content = f"# {title}\n\n"
+    lines = [f"# {title}\n\n"]
     if description:
-        content += f"## Description\n{description}\n\n"
+        lines.append(f"## Description\n{description}\n\n")
 
-    content += f"## Tasks\n"
+    lines.append("## Tasks\n")
     for i, task in enumerate(tasks, 1):
         task_name = task.get('name', f'Task {i}')
         task_desc = task.get('description', '')
-        content += f"- [ ] **{task_name}** - {task_desc}\n"
+        lines.append(f"- [ ] **{task_name}** - {task_desc}\n")
+    content = ''.join(lines)
 
     return create_action_file(
         str(plans_path),
@@ -200,27 +213,65 @@ def scan_for_approval_changes(vault_path: str) -> List[Dict]:
     changes = []
 
     vault_path = Path(vault_path)
+    cutoff = time.time() - 60
 
-    # Check Approved and Rejected directories for newly moved files
+    # Check Approved and Rejected directories for newly moved files.
+    # os.scandir hands back DirEntry objects with cached stat info, so each
+    # file costs at most one stat and stale files are skipped before opening.
     for dir_name in ["Approved", "Rejected"]:
         approval_dir = vault_path / dir_name
-        if approval_dir.exists():
-            for file_path in approval_dir.glob("*.md"):
-                # Check if this is a recent change (within last minute)
-                if (datetime.now() - datetime.fromtimestamp(file_path.stat().st_mtime)).seconds < 60:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-
-                    changes.append({
-                        "file_path": str(file_path),
-                        "status": dir_name.lower(),
-                        "content": content,
-                        "timestamp": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
-                    })
+        try:
+            entries = os.scandir(approval_dir)
+        except FileNotFoundError:
+            continue
+
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith('.md'):
+                    continue
+                st = entry.stat()
+                # Only recent changes (within the last minute) are of interest
+                if st.st_mtime < cutoff:
+                    continue
+                with open(entry.path, 'r', encoding='utf-8', buffering=65536) as f:
+                    content = f.read()
+
+                changes.append({
+                    "file_path": entry.path,
+                    "status": dir_name.lower(),
+                    "content": content,
+                    "timestamp": datetime.fromtimestamp(st.st_mtime).isoformat()
+                })
 
     return changes
 
 
+def _walk_files(dir_path: str) -> List[Path]:
+    """
+    Recursively collect all files under a directory using os.scandir.
+
+    Args:
+        dir_path: Directory to walk
+
+    Returns:
+        List of Paths to all files in the tree
+    """
+    files: List[Path] = []
+    stack = [dir_path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        files.append(Path(entry.path))
+        except (FileNotFoundError, PermissionError):
+            continue
+    return files
+
+
 def get_files_by_pattern(directory: str, pattern: str) -> List[Path]:
     """
     Get files from a directory that match a given pattern.
@@ -232,16 +283,11 @@ def get_files_by_pattern(directory: str, pattern: str) -> List[Path]:
     Returns:
         List of Paths to matching files
     """
-    dir_path = Path(directory)
-    if not dir_path.exists():
-        return []
-
-    matches = []
-    for file_path in dir_path.rglob(f"*{pattern}*"):
-        if file_path.is_file():
-            matches.append(file_path)
-
-    return matches
+    # Walked fresh each call: a directory's mtime only reflects its
+    # direct children, so there is no cheap stat that detects changes
+    # deeper in the tree, and a stale listing is worse than the walk
+    files = _walk_files(str(directory))
+    return [file_path for file_path in files if pattern in file_path.name]
 
 
 if __name__ == "__main__":
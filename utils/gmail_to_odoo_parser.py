@@ -0,0 +1,609 @@
+"""
+Gmail to Odoo Parser Module for the Personal AI Employee system.
+Detects invoice requests in incoming Gmail messages, extracts the invoice
+details, and creates draft invoices in the vault for human approval before
+they are sent to Odoo.
+"""
+
+import hashlib
+import logging
+import os
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from datetime import datetime, date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from utils.setup_logger import setup_logger, log_structured_action
+
+# RE2 matches in linear time with no backtracking, which both speeds up and
+# hardens the extraction patterns on hostile bodies; stdlib re is the
+# fallback when the binding is not installed or rejects a pattern
+try:
+    import re2 as _re2
+except ImportError:  # pragma: no cover - optional dependency
+    _re2 = None
+
+
+def _compile(pattern: str, flags: int = 0):
+    """Compile a pattern with RE2 when available, else stdlib re."""
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern, flags)
+        except Exception:
+            pass
+    return re.compile(pattern, flags)
+
+
+# One logger for the module; setting it up per call would repeat the
+# handler lookup and registration on every processed email
+_LOGGER = setup_logger("GmailToOdooParser", level=logging.INFO)
+
+# Keyword patterns that indicate an email is asking for an invoice or quote
+INVOICE_KEYWORDS = [
+    r'\binvoice\b',
+    r'\bquote\b',
+    r'\bquotation\b',
+    r'\bbilling\b',
+    r'\bbill\s+(?:me|us)\b',
+    r'\bproforma\b',
+    r'\bpurchase\s+order\b',
+    r'\bestimate\b',
+    r'\bpayment\s+request\b',
+    r'\bsend\s+(?:me\s+)?(?:an?\s+)?invoice\b',
+    r'\bneed\s+an?\s+invoice\b',
+    r'\binvoice\s+request\b',
+]
+
+# Patterns that capture a money amount from the email text
+AMOUNT_PATTERNS = [
+    r'total\s*[:\-]?\s*\$?\s*([\d,]+(?:\.\d{2})?)',
+    r'amount\s*[:\-]?\s*\$?\s*([\d,]+(?:\.\d{2})?)',
+    r'price\s*[:\-]?\s*\$?\s*([\d,]+(?:\.\d{2})?)',
+    r'invoice\s+for\s+\$?\s*([\d,]+(?:\.\d{2})?)',
+    r'\$\s*([\d,]+(?:\.\d{2})?)',
+    r'([\d,]+(?:\.\d{2})?)\s*(?:usd|dollars)',
+]
+
+# Patterns that capture a due date or payment term
+DUE_DATE_PATTERNS = [
+    r'due\s+(?:by|on|date)?\s*[:\-]?\s*(\d{4}-\d{2}-\d{2})',
+    r'due\s+(?:by|on|date)?\s*[:\-]?\s*(\d{1,2}/\d{1,2}/\d{2,4})',
+    r'(?:net|within)\s+(\d{1,3})\s+days',
+    r'payment\s+terms?\s*[:\-]?\s*(\d{1,3})\s+days',
+    r'due\s+(?:by|on)?\s*[:\-]?\s*((?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+\d{1,2},?\s*\d{0,4})',
+]
+
+# Patterns that capture the customer or company to bill. These stay
+# case-sensitive: the capitalized-name capture is the heuristic that keeps
+# ordinary prose from matching.
+CUSTOMER_NAME_PATTERNS = [
+    r'(?:[Cc]lient|[Cc]ustomer|[Cc]ompany)\s*(?:[Nn]ame)?\s*[:\-]\s*([A-Z][A-Za-z0-9\s&.\-]+)',
+    r'(?:[Bb]ill|[Ii]nvoice)\s+to\s*[:\-]?\s*([A-Z][A-Za-z0-9\s&.\-]+)',
+    r'[Ii]nvoice\s+for\s+([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)+)',
+]
+
+# Pattern for quantity/description/price line items like "2 x Widget @ $50".
+# Quantifiers are bounded so a pathological body cannot trigger runaway
+# backtracking, and re.ASCII skips Unicode table lookups per character.
+# The separators are captured so the caller can demand at least one
+# explicit 'x' or '@'; a bare "number word number" trigram is not a line
+# item.
+LINE_ITEM_PATTERN = (
+    r'(?P<qty>\d{1,6})\s*(?P<xsep>[xX\u00d7]\s*)?'
+    r'(?P<desc>[A-Za-z][A-Za-z0-9\s\-]{1,80}?)\s*'
+    r'(?P<atsep>[@\s]+)\$?(?P<price>[\d,]{1,12}(?:\.\d{2})?)'
+)
+
+# All patterns are compiled once at import; re-feeding raw strings to
+# re.search pays a cache lookup per pattern per email and risks evicting
+# other modules' patterns from the small global regex cache.
+_INVOICE_KEYWORDS_RE = [re.compile(p, re.IGNORECASE) for p in INVOICE_KEYWORDS]
+_AMOUNT_PATTERNS_RE = [re.compile(p, re.IGNORECASE) for p in AMOUNT_PATTERNS]
+
+# Fused alternations for detection: one pass over the email text instead of
+# one full scan per keyword/amount pattern
+_INVOICE_ALTERNATION = re.compile('|'.join(f'(?:{p})' for p in INVOICE_KEYWORDS), re.IGNORECASE)
+_AMOUNT_ALTERNATION = _compile('|'.join(f'(?:{p})' for p in AMOUNT_PATTERNS), re.IGNORECASE)
+
+# Substring prescreen: most polled emails are not invoice requests, and a
+# plain `in` check is orders of magnitude cheaper than the regex pass
+_KEYWORD_HINTS = ("invoice", "quote", "quotation", "bill", "proforma",
+                  "purchase order", "estimate", "payment request")
+
+# Invoice details almost always sit in the first few KB of the body; quoted
+# threads and signatures below that only add regex work, so scanning is
+# bounded to this window
+_SCAN_WINDOW = 4096
+_LINE_ITEM_RE = _compile(LINE_ITEM_PATTERN, re.IGNORECASE | re.ASCII)
+
+# Sender-header and filename helpers, compiled once like everything else so
+# per-email calls skip the global regex-cache lookup
+_SENDER_EMAIL_RE = re.compile(r'[\w.+\-]+@[\w.\-]+\.\w+')
+_DISPLAY_NAME_RE = re.compile(r'^([^<@]+?)\s*<')
+
+
+def _safe_email_id(email_id: str) -> str:
+    """
+    Filename-safe token for an email id.
+
+    A short BLAKE2b digest is always ASCII hex, needs no regex
+    sanitizing, and stays unique for distinct ids even after the old
+    16-character truncation would have collided.
+
+    Args:
+        email_id: Raw email identifier
+
+    Returns:
+        16-character hex digest
+    """
+    return hashlib.blake2b(email_id.encode('utf-8'), digest_size=8).hexdigest()
+
+
+@lru_cache(maxsize=512)
+def _parse_sender(from_addr: str) -> Tuple[str, str]:
+    """
+    Parse (display_name, address) out of a From header.
+
+    Cached because a polled inbox sees the same senders over and over —
+    reply threads and recurring customers hit the cache instead of the
+    two regex scans.
+
+    Args:
+        from_addr: Raw From header value
+
+    Returns:
+        Tuple of (display name, email address), either possibly empty
+    """
+    name = ''
+    address = ''
+    email_match = _SENDER_EMAIL_RE.search(from_addr)
+    if email_match:
+        address = email_match.group(0)
+    name_match = _DISPLAY_NAME_RE.match(from_addr)
+    if name_match:
+        name = name_match.group(1).strip().strip('"')
+    return name, address
+
+# Double quotes break the YAML frontmatter strings; one prebuilt translate
+# table swaps them for single quotes in a single C-level pass
+_YAML_ESCAPE = str.maketrans({'"': "'"})
+
+# Every detail category fused into one alternation with a named group per
+# branch, so extract_invoice_details makes a single pass over the email text
+# instead of one full scan per amount/due-date/customer pattern. Amount and
+# due-date branches are case-insensitive via inline (?i:...) groups; the
+# customer branches keep the case-sensitive capitalized-name heuristic. The
+# line-item pattern stays separate because it has its own named subgroups.
+_DETAILS_RE = _compile(
+    r'(?i:total\s*[:\-]?\s*\$?\s*(?P<amt_total>[\d,]+(?:\.\d{2})?))'
+    r'|(?i:amount\s*[:\-]?\s*\$?\s*(?P<amt_amount>[\d,]+(?:\.\d{2})?))'
+    r'|(?i:price\s*[:\-]?\s*\$?\s*(?P<amt_price>[\d,]+(?:\.\d{2})?))'
+    r'|(?i:invoice\s+for\s+\$?\s*(?P<amt_invoice_for>[\d,]+(?:\.\d{2})?))'
+    r'|(?i:\$\s*(?P<amt_dollar>[\d,]+(?:\.\d{2})?))'
+    r'|(?i:(?P<amt_usd>[\d,]+(?:\.\d{2})?)\s*(?:usd|dollars))'
+    r'|(?i:due\s+(?:by|on|date)?\s*[:\-]?\s*(?P<due_iso>\d{4}-\d{2}-\d{2}))'
+    r'|(?i:due\s+(?:by|on|date)?\s*[:\-]?\s*(?P<due_slash>\d{1,2}/\d{1,2}/\d{2,4}))'
+    r'|(?i:(?:net|within)\s+(?P<due_net>\d{1,3})\s+days)'
+    r'|(?i:payment\s+terms?\s*[:\-]?\s*(?P<due_terms>\d{1,3})\s+days)'
+    r'|(?i:due\s+(?:by|on)?\s*[:\-]?\s*(?P<due_textual>(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+\d{1,2},?\s*\d{0,4}))'
+    r'|(?:[Cc]lient|[Cc]ustomer|[Cc]ompany)\s*(?:[Nn]ame)?\s*[:\-]\s*(?P<cust_label>[A-Z][A-Za-z0-9\s&.\-]+)'
+    r'|(?:[Bb]ill|[Ii]nvoice)\s+to\s*[:\-]?\s*(?P<cust_bill_to>[A-Z][A-Za-z0-9\s&.\-]+)'
+    r'|[Ii]nvoice\s+for\s+(?P<cust_invoice_for>[A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+)+)'
+)
+
+# Import-time specialization: the per-hit category is precomputed from the
+# pattern's group index, so the extraction loop does one dict lookup per
+# match instead of repeated string-prefix checks
+_GROUP_CATEGORY = {name: name.split('_', 1)[0] for name in _DETAILS_RE.groupindex}
+
+
+@dataclass(slots=True)
+class InvoiceLineItem:
+    """One quantity/description/price line extracted from an email."""
+    description: str
+    quantity: int = 1
+    unit_price: float = 0.0
+    # Computed once at construction; the draft renderer and to_dict each
+    # read it several times per item
+    subtotal: float = field(init=False)
+
+    def __post_init__(self):
+        self.subtotal = round(self.quantity * self.unit_price, 2)
+
+
+@dataclass(slots=True)
+class InvoiceDetails:
+    """Invoice details extracted from an email."""
+    customer_name: str = ""
+    customer_email: str = ""
+    total_amount: float = 0.0
+    due_date: str = ""
+    line_items: List[InvoiceLineItem] = field(default_factory=list)
+    notes: str = ""
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether enough detail was extracted to draft an invoice."""
+        return bool(self.customer_name) and self.total_amount > 0
+
+    def to_dict(self) -> Dict:
+        """Dictionary form of the details for logging and serialization."""
+        return {
+            'customer_name': self.customer_name,
+            'customer_email': self.customer_email,
+            'total_amount': self.total_amount,
+            'due_date': self.due_date,
+            'line_items': [
+                {
+                    'description': item.description,
+                    'quantity': item.quantity,
+                    'unit_price': item.unit_price,
+                    'subtotal': item.subtotal,
+                }
+                for item in self.line_items
+            ],
+            'notes': self.notes,
+        }
+
+
+def detect_invoice_request(email: Dict) -> Tuple[bool, float]:
+    """
+    Decide whether an email is asking for an invoice or quote.
+
+    Args:
+        email: Email dictionary with 'subject' and 'body' keys
+
+    Returns:
+        Tuple of (is_invoice_request, confidence) where confidence is 0.0-1.0
+    """
+    subject = email.get('subject', '')
+    body = email.get('body', '')
+    email_text = f"{subject}\n{body[:_SCAN_WINDOW]}"
+
+    # Cheap substring gate before any regex work
+    lowered = email_text.lower()
+    if not any(hint in lowered for hint in _KEYWORD_HINTS):
+        return False, 0.0
+
+    n_matched = sum(1 for _ in _INVOICE_ALTERNATION.finditer(email_text))
+    if not n_matched:
+        return False, 0.0
+
+    # More keyword hits mean a stronger signal, capped below certainty
+    confidence = min(0.4 + n_matched * 0.1, 0.8)
+
+    # A money amount alongside the keywords is a strong boost. The captured
+    # value is stashed on the email dict so extract_invoice_details does not
+    # have to rediscover the same amount in a second scan.
+    amount_match = _AMOUNT_ALTERNATION.search(email_text)
+    if amount_match:
+        confidence = min(confidence + 0.2, 0.95)
+        email['_amount_hint'] = next(
+            (g for g in amount_match.groups() if g), None)
+
+    return confidence >= 0.5, confidence
+
+
+def extract_invoice_details(email: Dict) -> InvoiceDetails:
+    """
+    Extract invoice details (customer, amount, due date, line items) from
+    an email.
+
+    Args:
+        email: Email dictionary with 'subject', 'body', and 'from' keys
+
+    Returns:
+        InvoiceDetails with whatever could be extracted
+    """
+    subject = email.get('subject', '')
+    body = email.get('body', '')
+    from_addr = email.get('from', '')
+    email_text = f"{subject}\n{body[:_SCAN_WINDOW]}"
+
+    details = InvoiceDetails()
+
+    # One clock read per email; reused for offset and default due dates
+    today = date.today()
+
+    # The sender is the default customer
+    sender_name, sender_email = _parse_sender(from_addr)
+    if sender_email:
+        details.customer_email = sender_email
+    if sender_name:
+        details.customer_name = sender_name
+
+    # A plausible sender display name is the customer: skipping the body
+    # customer patterns avoids the backtracking-prone capitalized-name
+    # branches entirely for the common named-sender case
+    have_sender_name = (
+        len(details.customer_name) > 2
+        and not details.customer_name[0].isdigit()
+    )
+
+    # One pass over the email text for every detail category. The first hit
+    # per category wins; later hits of the same category are ignored. Digit
+    # due-date captures are day offsets ("net 30"), otherwise the raw date
+    # string is kept. An explicit customer/company in the body only matters
+    # when the sender did not provide a usable display name.
+    # An amount already found by detect_invoice_request is reused directly
+    amount_hint = email.get('_amount_hint')
+    amount_found = False
+    if amount_hint:
+        try:
+            details.total_amount = float(amount_hint.replace(',', ''))
+            amount_found = True
+        except ValueError:
+            pass
+    due_found = False
+    customer_found = have_sender_name
+    for m in _DETAILS_RE.finditer(email_text):
+        group = m.lastgroup
+        if group is None:
+            continue
+        value = m.group(group)
+        category = _GROUP_CATEGORY[group]
+        if category == 'amt':
+            if amount_found:
+                continue
+            try:
+                details.total_amount = float(value.replace(',', ''))
+            except ValueError:
+                continue
+            amount_found = True
+        elif category == 'due':
+            if due_found:
+                continue
+            raw_date = value.strip()
+            if raw_date.isdigit():
+                details.due_date = (today + timedelta(days=int(raw_date))).isoformat()
+            else:
+                details.due_date = raw_date
+            due_found = True
+        else:  # cust
+            if customer_found:
+                continue
+            details.customer_name = value.strip().rstrip('.,')
+            customer_found = True
+        if amount_found and due_found and customer_found:
+            break
+
+    if not details.due_date:
+        # Default to 30-day terms
+        details.due_date = (today + timedelta(days=30)).isoformat()
+
+    # Quantity/description/price line items. Prose like "56 due 2026"
+    # fits the qty/desc/price shape, so a match only counts when it uses
+    # an explicit 'x' or '@' separator.
+    for m in _LINE_ITEM_RE.finditer(email_text):
+        if not m.group('xsep') and '@' not in m.group('atsep'):
+            continue
+        try:
+            unit_price = float(m.group('price').replace(',', ''))
+        except ValueError:
+            continue
+        details.line_items.append(InvoiceLineItem(
+            description=m.group('desc').strip(),
+            quantity=int(m.group('qty')),
+            unit_price=unit_price,
+        ))
+
+    # Line items are more precise than a bare amount match
+    if details.line_items:
+        details.total_amount = round(sum(item.subtotal for item in details.line_items), 2)
+
+    return details
+
+
+def create_invoice_draft(
+    vault_path: str,
+    email: Dict,
+    details: InvoiceDetails,
+    now: Optional[datetime] = None,
+) -> Optional[Path]:
+    """
+    Create a draft invoice file in Pending_Approval for human review.
+
+    Args:
+        vault_path: Path to the Obsidian vault
+        email: Source email dictionary
+        details: Extracted invoice details
+        now: Timestamp to use, so batch callers can share one clock read
+             across many emails (defaults to the current UTC time)
+
+    Returns:
+        Path to the created draft file, or None on failure
+    """
+    try:
+        pending_dir = Path(vault_path) / "Pending_Approval"
+        pending_dir.mkdir(parents=True, exist_ok=True)
+
+        if now is None:
+            now = datetime.utcnow()
+        today = now.strftime('%Y-%m-%d')
+        safe_id = _safe_email_id(email.get('id', 'unknown'))
+        draft_path = pending_dir / f"INVOICE_draft_{today}_{safe_id}.md"
+
+        safe_subject = email.get('subject', '').translate(_YAML_ESCAPE)
+        safe_customer = details.customer_name.translate(_YAML_ESCAPE)
+
+        # Line-item rows are emitted lazily; streaming them straight to the
+        # file keeps peak memory at one section rather than the whole
+        # document plus its encode buffer
+        yaml_items = (
+            f'  - description: "{item.description.translate(_YAML_ESCAPE)}"\n'
+            f'    quantity: {item.quantity}\n'
+            f'    unit_price: {item.unit_price}\n'
+            f'    subtotal: {item.subtotal}\n'
+            for item in details.line_items
+        )
+        if details.line_items:
+            md_rows = (
+                f"| {i} | {item.description} | {item.quantity} | ${item.unit_price:.2f} | ${item.subtotal:.2f} |\n"
+                for i, item in enumerate(details.line_items, 1)
+            )
+        else:
+            md_rows = iter([
+                f"| 1 | Services per email request | 1 | ${details.total_amount:.2f} | ${details.total_amount:.2f} |\n"
+            ])
+
+        header = f"""---
+type: odoo_invoice_draft
+status: pending
+created: {now.isoformat()}
+email_id: "{email.get('id', 'unknown')}"
+email_subject: "{safe_subject}"
+customer_name: "{safe_customer}"
+customer_email: "{details.customer_email}"
+total_amount: {details.total_amount}
+due_date: "{details.due_date}"
+line_items:{'' if details.line_items else ' []'}
+"""
+        body_header = f"""---
+
+# Draft Invoice: {details.customer_name or 'Unknown Customer'}
+
+## Customer
+- **Name**: {details.customer_name or 'Unknown'}
+- **Email**: {details.customer_email or 'Unknown'}
+
+## Line Items
+| # | Description | Qty | Unit Price | Subtotal |
+|---|-------------|-----|------------|----------|
+"""
+        footer = f"""
+**Total**: ${details.total_amount:.2f}
+**Due Date**: {details.due_date}
+
+## Instructions
+- Move this file to `/Approved` to create the invoice in Odoo
+- Move this file to `/Rejected` to discard this draft
+
+## Original Email Preview
+> {email.get('body', '')[:600]}
+"""
+
+        # Write to a sibling temp file and rename so watchers never see a
+        # half-written draft
+        tmp_path = draft_path.with_suffix('.md.tmp')
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(header)
+            f.writelines(yaml_items)
+            f.write(body_header)
+            f.writelines(md_rows)
+            f.write(footer)
+        os.replace(tmp_path, draft_path)
+
+        log_structured_action(
+            vault_path,
+            action='invoice_draft_created',
+            actor='gmail_to_odoo_parser',
+            service='odoo',
+            parameters={
+                'draft_file': str(draft_path),
+                'customer': details.customer_name,
+                'total_amount': details.total_amount,
+            },
+            logger=_LOGGER,
+        )
+
+        _LOGGER.info(f"Created invoice draft: {draft_path}")
+        return draft_path
+
+    except Exception as e:
+        _LOGGER.error(f"Error creating invoice draft: {e}")
+        return None
+
+
+def create_clarification_request(
+    vault_path: str,
+    email: Dict,
+    details: InvoiceDetails,
+    now: Optional[datetime] = None,
+) -> Optional[Path]:
+    """
+    Create a Needs_Action file asking for the invoice details that could
+    not be extracted from the email.
+
+    Args:
+        vault_path: Path to the Obsidian vault
+        email: Source email dictionary
+        details: Partially extracted invoice details
+        now: Timestamp to use, so batch callers can share one clock read
+             across many emails (defaults to the current UTC time)
+
+    Returns:
+        Path to the created clarification file, or None on failure
+    """
+    try:
+        needs_action_dir = Path(vault_path) / "Needs_Action"
+        needs_action_dir.mkdir(parents=True, exist_ok=True)
+
+        missing = []
+        if not details.customer_name:
+            missing.append("customer name")
+        if details.total_amount <= 0:
+            missing.append("invoice amount")
+
+        if now is None:
+            now = datetime.utcnow()
+        today = now.strftime('%Y-%m-%d')
+        safe_id = _safe_email_id(email.get('id', 'unknown'))
+        clarification_path = needs_action_dir / f"INVOICE_clarify_{today}_{safe_id}.md"
+
+        safe_subject = email.get('subject', '').translate(_YAML_ESCAPE)
+
+        content = f"""---
+type: invoice_clarification
+status: needs_action
+created: {now.isoformat()}
+email_id: "{email.get('id', 'unknown')}"
+email_subject: "{safe_subject}"
+---
+
+# Invoice Request Needs Clarification
+
+An invoice request was detected, but the following details are missing:
+{''.join(f'- {item}' + chr(10) for item in missing)}
+## What Was Extracted
+- **Customer**: {details.customer_name or 'Unknown'} ({details.customer_email or 'no email'})
+- **Amount**: ${details.total_amount:.2f}
+- **Due Date**: {details.due_date or 'Unknown'}
+
+## Original Email Preview
+> {email.get('body', '')[:600]}
+"""
+
+        clarification_path.write_text(content, encoding='utf-8')
+        _LOGGER.info(f"Created invoice clarification request: {clarification_path}")
+        return clarification_path
+
+    except Exception as e:
+        _LOGGER.error(f"Error creating clarification request: {e}")
+        return None
+
+
+if __name__ == "__main__":
+    # Example usage
+    import logging
+
+    logging.basicConfig(level=logging.INFO)
+
+    example_email = {
+        'id': 'msg_12345',
+        'subject': 'Invoice request for consulting',
+        'from': 'Jane Client <jane@example.com>',
+        'body': 'Hi, please send an invoice for last month.\n'
+                '2 x Consulting day @ $800\n'
+                'Net 30 days please.\nThanks!',
+    }
+
+    is_invoice, confidence = detect_invoice_request(example_email)
+    print(f"Invoice request: {is_invoice} (confidence: {confidence:.2f})")
+
+    if is_invoice:
+        details = extract_invoice_details(example_email)
+        print(f"Details: {details.to_dict()}")
+        draft = create_invoice_draft("./test_vault", example_email, details)
+        print(f"Draft: {draft}")
@@ -5,12 +5,171 @@ Monitors system health to ensure 24+ hours of uptime without manual intervention
 
 import json
 import logging
+import os
+import queue
 import threading
 import time
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
-from utils.setup_logger import setup_logger
+from utils.retry_handler import get_circuit_breaker
+from utils.setup_logger import setup_logger, log_structured_action
+
+# orjson serializes several times faster than stdlib json; fall back to
+# json when it is not installed
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional dependency
+    _orjson = None
+
+if _orjson is not None:
+    def _json_dumps_indented(obj) -> str:
+        """Serialize obj to indented JSON for human-facing files."""
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2).decode()
+
+    def _json_dumps_line(obj) -> str:
+        """Serialize obj to one compact JSON line."""
+        return _orjson.dumps(obj, default=str).decode()
+
+    _json_loads = _orjson.loads
+else:
+    def _json_dumps_indented(obj) -> str:
+        """Serialize obj to indented JSON for human-facing files."""
+        return json.dumps(obj, indent=2, default=str)
+
+    def _json_dumps_line(obj) -> str:
+        """Serialize obj to one compact JSON line."""
+        return json.dumps(obj, default=str)
+
+    _json_loads = json.loads
+
+
+# Literals shared by every structured-log call in this module; module
+# constants keep the hot logging paths free of repeated string building
+# and give the action names one place to live
+_ACTOR = "health_monitor"
+_ACTION_CIRCUIT_CHANGED = "mcp_circuit_state_changed"
+_ACTION_POLL_CYCLE = "mcp_health_poll_cycle"
+
+# Status severity as ordinals: worst-of reduces to a max() over ints.
+# Unknown statuses rank as 'warning' rather than raising or being ignored.
+_STATUS_ORD = {'ok': 0, 'warning': 1, 'critical': 2, 'error': 2, 'unknown': 1}
+_STATUS_NAMES = ('ok', 'warning', 'critical')
+
+# Health scores for the uptime report: critical=0.0, warning=0.5, ok=1.0
+_HEALTH_SCORES = {'critical': 0.0, 'warning': 0.5, 'ok': 1.0}
+
+
+class _LogBuffer:
+    """
+    Batches health-log entries and writes them from a background thread.
+
+    Callers append dictionaries; a daemon thread drains the queue every
+    flush interval (or as soon as it fills up) and appends the whole batch
+    as JSON lines in a single write, instead of one disk write per entry.
+    """
+
+    def __init__(self, log_file: Path, logger, flush_interval: float = 0.5,
+                 max_pending: int = 64, max_lines: int = 1000):
+        """
+        Initialize the buffer and start its writer thread.
+
+        Args:
+            log_file: JSONL file the entries are appended to
+            logger: Logger for write-failure reporting
+            flush_interval: Seconds between background flushes
+            max_pending: Queue size that triggers an immediate flush
+            max_lines: Line count that triggers file rotation
+        """
+        self.log_file = log_file
+        self.logger = logger
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_lines = max_lines
+        self._pending = deque()
+        self._lock = threading.Lock()
+        # flush() is reachable from the writer thread, stop_monitoring,
+        # and log readers at once; this lock serializes everything that
+        # touches the handle so a rotation never closes it mid-write
+        self._io_lock = threading.Lock()
+        # The file handle is opened once and kept; reopening on every
+        # flush paid an open/close syscall pair per batch
+        self._fh = open(log_file, 'a', encoding='utf-8', buffering=65536)
+        try:
+            with open(log_file, 'r', encoding='utf-8') as f:
+                self._line_count = sum(1 for _ in f)
+        except FileNotFoundError:
+            self._line_count = 0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def append(self, entry: Dict):
+        """
+        Queue one entry for writing.
+
+        Args:
+            entry: Health status dictionary
+        """
+        with self._lock:
+            self._pending.append(entry)
+            full = len(self._pending) >= self.max_pending
+        if full:
+            self._wake.set()
+
+    def flush(self):
+        """Write all pending entries to the open handle in one batch."""
+        with self._lock:
+            if not self._pending:
+                return
+            batch = list(self._pending)
+            self._pending.clear()
+
+        try:
+            with self._io_lock:
+                self._fh.write(''.join(_json_dumps_line(e) + '\n' for e in batch))
+                # One OS-level flush per batch of up to max_pending
+                # entries, not one per entry
+                self._fh.flush()
+                self._line_count += len(batch)
+                if self._line_count > self.max_lines:
+                    self._rotate()
+        except Exception as e:
+            self.logger.error(f"Error writing health log: {e}")
+
+    def _rotate(self):
+        """Trim the file back to its newest max_lines entries.
+
+        Must be called with _io_lock held.
+        """
+        self._fh.close()
+        with open(self.log_file, 'r', encoding='utf-8') as f:
+            # deque(f, maxlen=N) keeps only the tail while streaming,
+            # never holding the whole file in memory
+            tail = deque(f, maxlen=self.max_lines)
+        tmp = self.log_file.with_suffix('.jsonl.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.writelines(tail)
+        os.replace(tmp, self.log_file)
+        self._fh = open(self.log_file, 'a', encoding='utf-8', buffering=65536)
+        self._line_count = len(tail)
+
+    def close(self):
+        """Stop the writer thread, flush whatever is left, close the file."""
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout=2)
+        self.flush()
+        with self._io_lock:
+            self._fh.close()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
 
 
 class HealthMonitor:
@@ -33,15 +192,106 @@ class HealthMonitor:
         self.monitoring_thread = None
         self.health_checks = []
         self.system_start_time = datetime.now()
+        # Monotonic twin of the start time: elapsed-window math uses the
+        # monotonic clock, which is cheaper than datetime.now() and immune
+        # to wall-clock jumps
+        self._system_start_mono = time.monotonic()
         self.last_error_time = None
 
-        # Health log
-        self.health_log_file = self.vault_path / "Logs" / "health_monitor.json"
-        self.health_log_file.parent.mkdir(exist_ok=True)
+        # Events make the loop waits interruptible: stopping the monitor
+        # wakes the thread immediately instead of waiting out the interval
+        self._stop_event = threading.Event()
+        self._mcp_stop_event = threading.Event()
+
+        # MCP server watchdog state, kept as parallel dicts (one per
+        # field) rather than a dict-of-dicts: the poll loop touches one
+        # field at a time, and flat dicts skip a level of hashing plus
+        # the per-service inner-dict allocations
+        self._mcp_enabled: Dict[str, bool] = {
+            name: False for name in ('odoo', 'facebook', 'instagram', 'twitter')
+        }
+        self._mcp_status: Dict[str, str] = {
+            name: 'unknown' for name in self._mcp_enabled
+        }
+        self._mcp_last_check: Dict[str, Optional[datetime]] = {
+            name: None for name in self._mcp_enabled
+        }
+        self.mcp_polling = False
+        self.mcp_poll_thread = None
+        # Names with the watchdog enabled, kept separately so the poll
+        # loop skips disabled services without touching their dicts
+        self._enabled_services: set = set()
+
+        # Error and watchdog-restart tracking. State is locked per service
+        # so a noisy 'odoo' never serializes updates for 'facebook'; the
+        # guard lock only protects lazy lock creation.
+        self._service_locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self.error_window_seconds = 300
+        self.error_counts: Dict[str, Dict] = {}
+        self.error_history: Dict[str, deque] = {}
+        self.watchdog_restart_window = 3600
+        self.max_watchdog_restarts = 3
+        self.watchdog_restart_counts: Dict[str, Dict] = {}
+        # Per-service (window_start_mono, count) for log throttling; an
+        # error storm keeps its counters but stops emitting log lines
+        self.error_log_rate_limit = 20  # max logged errors per second
+        self._error_rate_tokens: Dict[str, tuple] = {}
+
+        # Last (state, failure_count) written to the structured log per
+        # service, so steady-state polling logs transitions, not identity
+        self._last_logged_state: Dict[str, tuple] = {}
+
+        # (fetched_at_mono, state dict) per service; breaker snapshots are
+        # cheap but lock-protected, so cache them briefly when several
+        # callers ask about the same service in one poll cycle
+        self._cb_state_cache: Dict[str, tuple] = {}
+        self.cb_state_cache_ttl = 10.0
+
+        # Parsed .mcp.json cached against the file's mtime
+        self._mcp_config_cache: Optional[tuple] = None
+
+        # Prime psutil's CPU sampling baseline so later interval=None
+        # calls return instantly with usage since the previous call
+        try:
+            import psutil
+            psutil.cpu_percent(interval=None)
+        except ImportError:
+            pass
 
-        # Initialize the health log file
-        if not self.health_log_file.exists():
-            self._write_health_log([])
+        # Health log: JSON lines appended in batches by a background writer
+        self.health_log_file = self.vault_path / "Logs" / "health_monitor.jsonl"
+        self.health_log_file.parent.mkdir(exist_ok=True)
+        self._log_buffer = _LogBuffer(self.health_log_file, self.logger)
+        # Ring buffer mirroring the newest log entries so reports never
+        # re-read and re-parse the file; seeded once from disk at startup
+        self._recent: deque = deque(self._iter_health_log(), maxlen=1000)
+
+        # Running 24h-window aggregates: (epoch, score, severity) tuples
+        # plus a sum and per-severity counters kept in step with the
+        # window, so uptime reports are O(1) instead of rescanning and
+        # reparsing every entry's timestamp
+        self._score_window: deque = deque()
+        self._score_sum = 0.0
+        self._critical_events = 0
+        self._warning_events = 0
+        for entry in self._recent:
+            ts = entry.get('ts')
+            if ts is None:
+                try:
+                    ts = datetime.fromisoformat(
+                        entry['timestamp'].replace('Z', '+00:00')).timestamp()
+                except (KeyError, ValueError):
+                    continue
+            self._track_health_entry(ts, entry.get('overall_health', 'ok'))
+
+        # Alert files are written by a consumer thread so the thread that
+        # hit the restart cap never blocks on disk I/O; the queue is
+        # bounded because a flood of identical alerts has no extra value
+        self._alert_queue: queue.Queue = queue.Queue(maxsize=32)
+        self._alert_thread = threading.Thread(
+            target=self._alert_worker, daemon=True)
+        self._alert_thread.start()
 
     def start_monitoring(self, check_interval: int = 300):  # Default: check every 5 minutes
         """
@@ -55,6 +305,7 @@ class HealthMonitor:
             return
 
         self.monitoring = True
+        self._stop_event.clear()
         self.logger.info("Starting health monitoring...")
 
         def monitor_loop():
@@ -72,8 +323,10 @@ class HealthMonitor:
                 except Exception as e:
                     self.logger.error(f"Error in health monitoring: {e}")
 
-                # Wait for the specified interval
-                time.sleep(check_interval)
+                # Interruptible wait: returns True (and we exit) as soon as
+                # stop_monitoring() sets the event
+                if self._stop_event.wait(check_interval):
+                    break
 
         self.monitoring_thread = threading.Thread(target=monitor_loop, daemon=True)
         self.monitoring_thread.start()
@@ -81,10 +334,371 @@ class HealthMonitor:
     def stop_monitoring(self):
         """Stop the health monitoring system."""
         self.monitoring = False
+        self._stop_event.set()
         if self.monitoring_thread:
             self.monitoring_thread.join(timeout=2)
+        self._log_buffer.flush()
+        self._alert_queue.put(None)
+        self._alert_thread.join(timeout=2)
         self.logger.info("Stopped health monitoring")
 
+    def enable_watchdog(self, service_name: str):
+        """
+        Enable watchdog polling for an MCP service.
+
+        Args:
+            service_name: Name of the MCP service (e.g., 'odoo')
+        """
+        if service_name not in self._mcp_status:
+            self._mcp_status[service_name] = 'unknown'
+            self._mcp_last_check[service_name] = None
+        self._mcp_enabled[service_name] = True
+        self._enabled_services.add(service_name)
+        self.logger.info(f"Watchdog enabled for {service_name}")
+
+    def disable_watchdog(self, service_name: str):
+        """
+        Disable watchdog polling for an MCP service.
+
+        Args:
+            service_name: Name of the MCP service
+        """
+        if service_name in self._mcp_enabled:
+            self._mcp_enabled[service_name] = False
+        self._enabled_services.discard(service_name)
+        self.logger.info(f"Watchdog disabled for {service_name}")
+
+    def get_mcp_servers(self) -> Dict[str, Dict]:
+        """
+        Get per-service watchdog state in dict-of-dicts form.
+
+        Returns:
+            Mapping of service name to enabled/status/last_check fields
+        """
+        return {
+            name: {
+                'enabled': self._mcp_enabled.get(name, False),
+                'status': self._mcp_status.get(name, 'unknown'),
+                'last_check': self._mcp_last_check.get(name),
+            }
+            for name in self._mcp_enabled
+        }
+
+    def check_mcp_server_health(self, service_name: str) -> Dict:
+        """
+        Check the health of a single MCP server.
+
+        Args:
+            service_name: Name of the MCP service
+
+        Returns:
+            Dictionary with the service health status
+        """
+        state = self._circuit_state(service_name)
+        status = 'ok' if state.get('state') == 'closed' else 'warning'
+        result = {'service': service_name, 'status': status, 'circuit': state}
+
+        with self._lock_for(service_name):
+            self._mcp_enabled.setdefault(service_name, False)
+            self._mcp_status[service_name] = result['status']
+            self._mcp_last_check[service_name] = datetime.now()
+
+        # A steady circuit produces no log churn: only transitions in
+        # (state, failure_count) are worth a structured-log entry
+        key = (state.get('state'), state.get('failure_count'))
+        if self._last_logged_state.get(service_name) != key:
+            self._last_logged_state[service_name] = key
+            log_structured_action(
+                str(self.vault_path),
+                action=_ACTION_CIRCUIT_CHANGED,
+                actor=_ACTOR,
+                service=service_name,
+                parameters={'state': key[0], 'failure_count': key[1]},
+                logger=self.logger,
+            )
+            if status != 'ok':
+                self.logger.warning(
+                    f"Circuit for {service_name} is {key[0]} "
+                    f"({key[1]} failures)")
+        return result
+
+    def _circuit_state(self, service_name: str) -> Dict:
+        """
+        Get the circuit-breaker state for a service, cached briefly.
+
+        Args:
+            service_name: Name of the service
+
+        Returns:
+            State snapshot from the service's CircuitBreaker
+        """
+        now_mono = time.monotonic()
+        cached = self._cb_state_cache.get(service_name)
+        if cached is not None and now_mono - cached[0] < self.cb_state_cache_ttl:
+            return cached[1]
+        state = get_circuit_breaker(service_name).get_state()
+        self._cb_state_cache[service_name] = (now_mono, state)
+        return state
+
+    def _lock_for(self, service_name: str) -> threading.Lock:
+        """
+        Get (lazily creating) the lock for one service.
+
+        Args:
+            service_name: Name of the service
+
+        Returns:
+            The lock guarding that service's state
+        """
+        lock = self._service_locks.get(service_name)
+        if lock is None:
+            with self._locks_guard:
+                lock = self._service_locks.setdefault(service_name, threading.Lock())
+        return lock
+
+    def record_error(self, service_name: str, error: Exception):
+        """
+        Record an error for a service inside its rolling window.
+
+        Args:
+            service_name: Service the error belongs to
+            error: The exception that occurred
+        """
+        # One wall-clock read per call for the human-readable timestamp;
+        # window arithmetic runs on the monotonic clock
+        now = datetime.now()
+        now_mono = time.monotonic()
+        with self._lock_for(service_name):
+            window = self.error_counts.get(service_name)
+            if window is None or now_mono - window['window_start_mono'] > self.error_window_seconds:
+                # Each service resets its own window independently
+                window = {'count': 0, 'window_start': now, 'window_start_mono': now_mono}
+                self.error_counts[service_name] = window
+            window['count'] += 1
+
+            history = self.error_history.get(service_name)
+            if history is None:
+                # maxlen keeps append+evict O(1); the old slice-rewrite
+                # copied all 100 entries on every append past the cap
+                history = deque(maxlen=100)
+                self.error_history[service_name] = history
+            # Stored as a raw epoch float; isoformat() on every error is
+            # wasted work when most entries are never read back
+            history.append({
+                'ts': now.timestamp(),
+                'message': str(error),
+                'type': type(error).__name__,
+            })
+
+            # Rate-limit the log line, not the counters: during an error
+            # storm formatting and writing thousands of identical warnings
+            # costs more than the errors themselves
+            token_start, token_count = self._error_rate_tokens.get(
+                service_name, (now_mono, 0))
+            if now_mono - token_start >= 1.0:
+                token_start, token_count = now_mono, 0
+            token_count += 1
+            self._error_rate_tokens[service_name] = (token_start, token_count)
+
+        if token_count <= self.error_log_rate_limit:
+            self.logger.warning(f"Error recorded for {service_name}: {error}")
+        elif token_count == self.error_log_rate_limit + 1:
+            self.logger.warning(
+                f"Error recorded for {service_name}: {error} (throttled)")
+
+    def get_error_history(self, service_name: str, last_n: int = 10) -> List[Dict]:
+        """
+        Get the most recent errors recorded for a service.
+
+        Args:
+            service_name: Service to look up
+            last_n: Maximum number of entries to return
+
+        Returns:
+            List of error dictionaries, most recent last
+        """
+        with self._lock_for(service_name):
+            history = self.error_history.get(service_name)
+            if not history:
+                return []
+            # One outbound copy; the deque itself is never sliced
+            recent = list(history)[-last_n:]
+        # Human-readable timestamps are rendered on the read path only
+        return [
+            {
+                'timestamp': datetime.fromtimestamp(e['ts']).isoformat(),
+                'message': e['message'],
+                'type': e['type'],
+            }
+            for e in recent
+        ]
+
+    def get_error_report(self) -> Dict:
+        """
+        Get current error counts per service.
+
+        Returns:
+            Dictionary mapping service name to its error-window counts
+        """
+        report = {}
+        for service_name in list(self.error_counts):
+            with self._lock_for(service_name):
+                window = self.error_counts.get(service_name)
+                if window:
+                    report[service_name] = {
+                        'count': window['count'],
+                        'window_start': window['window_start'].isoformat(),
+                    }
+        return report
+
+    def attempt_service_restart(self, service_name: str) -> bool:
+        """
+        Record a watchdog restart attempt for a service.
+
+        Restart attempts are capped inside a rolling window; when the cap
+        is exceeded an alert file is created instead.
+
+        Args:
+            service_name: Service being restarted
+
+        Returns:
+            True if the restart may proceed, False if the cap was hit
+        """
+        now = datetime.now()
+        now_mono = time.monotonic()
+        with self._lock_for(service_name):
+            window = self.watchdog_restart_counts.get(service_name)
+            if window is None or now_mono - window['window_start_mono'] > self.watchdog_restart_window:
+                window = {'count': 0, 'window_start': now, 'window_start_mono': now_mono}
+                self.watchdog_restart_counts[service_name] = window
+
+            if window['count'] >= self.max_watchdog_restarts:
+                restart_count = window['count']
+            else:
+                window['count'] += 1
+                restart_count = None
+
+        if restart_count is not None:
+            self.logger.critical(
+                f"Watchdog restart cap reached for {service_name} ({restart_count} in window)")
+            self._create_alert(service_name, restart_count)
+            return False
+
+        self.logger.warning(f"Watchdog restart attempt for {service_name}")
+        return True
+
+    def _create_alert(self, service_name: str, restart_count: int):
+        """
+        Queue a Needs_Action alert for a service stuck in restart loops.
+
+        The file itself is written by the alert worker thread; if the
+        queue is full the alert is dropped with a warning, since earlier
+        queued alerts already cover the same failure.
+
+        Args:
+            service_name: Service that exceeded the restart cap
+            restart_count: Restarts recorded in the current window
+        """
+        try:
+            self._alert_queue.put_nowait((service_name, restart_count))
+        except queue.Full:
+            self.logger.warning(
+                f"Alert queue full, dropping alert for {service_name}")
+
+    def _alert_worker(self):
+        """Drain the alert queue, writing one alert file per item."""
+        while True:
+            item = self._alert_queue.get()
+            if item is None:  # Shutdown sentinel from stop_monitoring
+                break
+            self._write_alert(*item)
+
+    def _write_alert(self, service_name: str, restart_count: int):
+        """
+        Write a Needs_Action alert file for a service.
+
+        Args:
+            service_name: Service that exceeded the restart cap
+            restart_count: Restarts recorded in the current window
+        """
+        try:
+            alerts_dir = self.vault_path / "Needs_Action"
+            alerts_dir.mkdir(parents=True, exist_ok=True)
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            alert_file = alerts_dir / f"ALERT_watchdog_{service_name}_{timestamp}.md"
+            alert_file.write_text(
+                f"# Watchdog Alert: {service_name}\n\n"
+                f"Service `{service_name}` hit the restart cap "
+                f"({restart_count} restarts in the current window) and needs "
+                f"manual attention.\n\n"
+                f"## Error Report\n```json\n"
+                f"{_json_dumps_indented(self.get_error_report())}\n```\n",
+                encoding='utf-8',
+            )
+        except Exception as e:
+            self.logger.error(f"Error creating watchdog alert: {e}")
+
+    def start_mcp_polling(self, poll_interval: int = 30):
+        """
+        Start the MCP server watchdog polling loop.
+
+        Args:
+            poll_interval: Interval in seconds between watchdog polls
+        """
+        if self.mcp_polling:
+            self.logger.warning("MCP polling is already running")
+            return
+
+        self.mcp_polling = True
+        self._mcp_stop_event.clear()
+        self.logger.info("Starting MCP server polling...")
+
+        def _mcp_poll_loop():
+            while self.mcp_polling:
+                # Snapshot avoids size-changed errors if a watchdog is
+                # toggled mid-iteration
+                results = []
+                for service_name in list(self._enabled_services):
+                    try:
+                        result = self.check_mcp_server_health(service_name)
+                        results.append(
+                            {'service': service_name, 'status': result['status']})
+                    except Exception as e:
+                        self.logger.error(f"Error polling {service_name}: {e}")
+                        self.record_error(service_name, e)
+                        results.append(
+                            {'service': service_name, 'status': 'error'})
+
+                # One structured-log entry summarizes the whole cycle
+                # instead of one file append per polled service
+                if results:
+                    log_structured_action(
+                        str(self.vault_path),
+                        action=_ACTION_POLL_CYCLE,
+                        actor=_ACTOR,
+                        parameters={
+                            'poll_interval_s': poll_interval,
+                            'service_count': len(results),
+                            'results': results,
+                        },
+                        logger=self.logger,
+                    )
+
+                # Interruptible wait, same as the main monitor loop
+                if self._mcp_stop_event.wait(poll_interval):
+                    break
+
+        self.mcp_poll_thread = threading.Thread(target=_mcp_poll_loop, daemon=True)
+        self.mcp_poll_thread.start()
+
+    def stop_mcp_polling(self):
+        """Stop the MCP server watchdog polling loop."""
+        self.mcp_polling = False
+        self._mcp_stop_event.set()
+        if self.mcp_poll_thread:
+            self.mcp_poll_thread.join(timeout=2)
+        self.logger.info("Stopped MCP server polling")
+
     def perform_health_check(self) -> Dict:
         """
         Perform a comprehensive health check of the system.
@@ -108,10 +722,13 @@ class HealthMonitor:
             # Calculate overall health
             overall_health = self._calculate_overall_health(resource_status, vault_status, watcher_status, mcp_status)
 
-            # Create health report
+            # Create health report. 'ts' is the machine-readable epoch
+            # float the report math compares directly; the ISO string is
+            # kept for humans reading the log
             health_report = {
+                'ts': time.time(),
                 'timestamp': datetime.now().isoformat(),
-                'uptime_hours': (datetime.now() - self.system_start_time).total_seconds() / 3600,
+                'uptime_hours': (time.monotonic() - self._system_start_mono) / 3600,
                 'overall_health': overall_health,
                 'system_resources': resource_status,
                 'vault_accessibility': vault_status,
@@ -124,6 +741,7 @@ class HealthMonitor:
         except Exception as e:
             self.logger.error(f"Error performing health check: {e}")
             return {
+                'ts': time.time(),
                 'timestamp': datetime.now().isoformat(),
                 'error': str(e),
                 'overall_health': 'critical'
@@ -139,16 +757,20 @@ class HealthMonitor:
         try:
             import psutil
 
-            # Get CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # interval=None returns immediately with the CPU usage since
+            # the previous call (the baseline was primed in __init__);
+            # interval=1 blocked the monitoring thread for a full second
+            # on every check
+            cpu_percent = psutil.cpu_percent(interval=None)
 
             # Get memory usage
             memory = psutil.virtual_memory()
             memory_percent = memory.percent
 
-            # Get disk usage
-            disk = psutil.disk_usage('/')
-            disk_percent = (disk.used / disk.total) * 100
+            # Get disk usage straight from statvfs; psutil.disk_usage
+            # wraps the same call in extra conversions and a namedtuple
+            svfs = os.statvfs('/')
+            disk_percent = (1 - svfs.f_bavail / svfs.f_blocks) * 100
 
             # Check if resources are within acceptable limits
             cpu_status = 'ok' if cpu_percent < 80 else 'warning' if cpu_percent < 90 else 'critical'
@@ -171,10 +793,14 @@ class HealthMonitor:
                 'status': 'critical'
             }
 
-    def _check_vault_accessibility(self) -> Dict:
+    def _check_vault_accessibility(self, check_write_probe: bool = False) -> Dict:
         """
         Check if the vault is accessible.
 
+        Args:
+            check_write_probe: Also create and delete a probe file instead
+                of trusting os.access alone
+
         Returns:
             Dictionary containing vault status
         """
@@ -189,7 +815,24 @@ class HealthMonitor:
                     'status': 'critical'
                 }
 
-            # Check if we can read/write to vault
+            # os.access asks the kernel about permissions without the two
+            # extra syscalls (create + unlink) the old probe file cost on
+            # every check
+            if not os.access(vault_path, os.R_OK | os.W_OK):
+                return {
+                    'accessible': False,
+                    'error': 'Permission denied accessing vault',
+                    'status': 'critical'
+                }
+
+            if not check_write_probe:
+                return {
+                    'accessible': True,
+                    'status': 'ok'
+                }
+
+            # Probe write catches cases os.access cannot (read-only
+            # mounts, full disks); only run it when explicitly requested
             test_file = vault_path / ".health_test"
             try:
                 test_file.touch()
@@ -198,7 +841,7 @@ class HealthMonitor:
                     'accessible': True,
                     'status': 'ok'
                 }
-            except PermissionError:
+            except (PermissionError, OSError):
                 return {
                     'accessible': False,
                     'error': 'Permission denied accessing vault',
@@ -237,7 +880,9 @@ class HealthMonitor:
         # Check if MCP configuration exists
         mcp_config_path = Path.cwd() / ".mcp.json"
 
-        if not mcp_config_path.exists():
+        try:
+            st = mcp_config_path.stat()
+        except FileNotFoundError:
             return {
                 'config_exists': False,
                 'status': 'warning',
@@ -245,8 +890,14 @@ class HealthMonitor:
             }
 
         try:
-            with open(mcp_config_path, 'r') as f:
-                config = json.load(f)
+            # The config rarely changes; reparse only when its mtime moves
+            cached = self._mcp_config_cache
+            if cached is not None and cached[0] == st.st_mtime_ns:
+                config = cached[1]
+            else:
+                with open(mcp_config_path, 'r') as f:
+                    config = json.load(f)
+                self._mcp_config_cache = (st.st_mtime_ns, config)
 
             servers = config.get('mcpServers', {})
             server_status = {}
@@ -272,6 +923,45 @@ class HealthMonitor:
                 'status': 'critical'
             }
 
+    def check_log_retention(self, retention_days: int = 90) -> Dict:
+        """
+        Report on the daily action logs kept in <vault>/Logs.
+
+        Daily logs are named YYYY-MM-DD.json, so lexicographic min/max of
+        the names are also the chronological oldest/newest — one scandir
+        pass with no sorted listing or per-entry Path objects.
+
+        Args:
+            retention_days: Age in days beyond which old logs are flagged
+
+        Returns:
+            Dictionary with file count, oldest/newest names, and status
+        """
+        log_dir = self.vault_path / "Logs"
+        try:
+            with os.scandir(log_dir) as it:
+                names = [e.name for e in it if e.name.endswith('.json')]
+        except FileNotFoundError:
+            names = []
+
+        if not names:
+            return {'log_files': 0, 'oldest': None, 'newest': None, 'status': 'ok'}
+
+        oldest = min(names)
+        newest = max(names)
+        try:
+            age_days = (datetime.now() - datetime.fromisoformat(oldest[:-5])).days
+        except ValueError:
+            age_days = 0
+
+        return {
+            'log_files': len(names),
+            'oldest': oldest,
+            'newest': newest,
+            'retention_days': retention_days,
+            'status': 'warning' if age_days > retention_days else 'ok',
+        }
+
     def _calculate_overall_health(self, resource_status: Dict, vault_status: Dict,
                                  watcher_status: Dict, mcp_status: Dict) -> str:
         """
@@ -309,12 +999,8 @@ class HealthMonitor:
         Returns:
             The worst status ('critical', 'warning', or 'ok')
         """
-        if 'critical' in statuses:
-            return 'critical'
-        elif 'warning' in statuses:
-            return 'warning'
-        else:
-            return 'ok'
+        return _STATUS_NAMES[
+            max((_STATUS_ORD.get(s, 1) for s in statuses), default=0)]
 
     def _log_health_status(self, health_status: Dict):
         """
@@ -323,22 +1009,45 @@ class HealthMonitor:
         Args:
             health_status: Dictionary containing health status
         """
-        try:
-            # Read existing log
-            existing_log = self._read_health_log()
-
-            # Add new status
-            existing_log.append(health_status)
+        self._recent.append(health_status)
+        self._track_health_entry(
+            health_status.get('ts') or time.time(),
+            health_status.get('overall_health', 'ok'))
+        self._log_buffer.append(health_status)
 
-            # Keep only last 1000 entries to prevent log from growing too large
-            if len(existing_log) > 1000:
-                existing_log = existing_log[-1000:]
+    def _track_health_entry(self, ts: float, overall_health: str):
+        """
+        Fold one health entry into the running 24h aggregates.
 
-            # Write updated log
-            self._write_health_log(existing_log)
+        Args:
+            ts: Entry timestamp as an epoch float
+            overall_health: The entry's overall health status
+        """
+        score = _HEALTH_SCORES.get(overall_health, 0.5)
+        self._score_window.append((ts, score, overall_health))
+        self._score_sum += score
+        if overall_health == 'critical':
+            self._critical_events += 1
+        elif overall_health == 'warning':
+            self._warning_events += 1
+        self._evict_expired(ts)
+
+    def _evict_expired(self, now_ts: float):
+        """
+        Drop window entries older than 24 hours, unwinding their scores.
 
-        except Exception as e:
-            self.logger.error(f"Error logging health status: {e}")
+        Args:
+            now_ts: Current time as an epoch float
+        """
+        cutoff = now_ts - 86400
+        window = self._score_window
+        while window and window[0][0] < cutoff:
+            _, score, severity = window.popleft()
+            self._score_sum -= score
+            if severity == 'critical':
+                self._critical_events -= 1
+            elif severity == 'warning':
+                self._warning_events -= 1
 
     def _read_health_log(self) -> List[Dict]:
         """
@@ -347,24 +1056,21 @@ class HealthMonitor:
         Returns:
             List of health status dictionaries
         """
-        try:
-            with open(self.health_log_file, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
-
-    def _write_health_log(self, log_data: List[Dict]):
-        """
-        Write the health log to file.
+        # Make sure queued entries are visible to the reader
+        self._log_buffer.flush()
+        return list(self._iter_health_log())
 
-        Args:
-            log_data: List of health status dictionaries
-        """
+    def _iter_health_log(self):
+        """Yield health log entries one parsed line at a time."""
         try:
-            with open(self.health_log_file, 'w') as f:
-                json.dump(log_data, f, indent=2)
-        except Exception as e:
-            self.logger.error(f"Error writing health log: {e}")
+            with open(self.health_log_file, 'r') as f:
+                for line in f:
+                    try:
+                        yield _json_loads(line)
+                    except ValueError:
+                        continue  # Skip partial or corrupt lines
+        except FileNotFoundError:
+            return
 
     def _handle_issues(self, health_status: Dict):
         """
@@ -406,61 +1112,29 @@ class HealthMonitor:
         uptime = datetime.now() - self.system_start_time
         hours = uptime.total_seconds() / 3600
 
-        # Read health log to assess stability
-        health_log = self._read_health_log()
-
-        # Count critical and warning events in the last 24 hours
-        last_24h = datetime.now() - timedelta(hours=24)
-        critical_events = 0
-        warning_events = 0
-
-        for entry in health_log:
-            try:
-                entry_time = datetime.fromisoformat(entry['timestamp'].replace('Z', '+00:00'))
-                if entry_time >= last_24h:
-                    if entry.get('overall_health') == 'critical':
-                        critical_events += 1
-                    elif entry.get('overall_health') == 'warning':
-                        warning_events += 1
-            except:
-                continue  # Skip invalid entries
+        # Aggregates are maintained as entries are logged; just expire
+        # anything that aged past the window since the last append
+        self._evict_expired(time.time())
 
         return {
             'total_uptime_hours': hours,
             'system_start_time': self.system_start_time.isoformat(),
-            'critical_events_last_24h': critical_events,
-            'warning_events_last_24h': warning_events,
-            'average_health_score': self._calculate_average_health_score(health_log)
+            'critical_events_last_24h': self._critical_events,
+            'warning_events_last_24h': self._warning_events,
+            'average_health_score': self._calculate_average_health_score()
         }
 
-    def _calculate_average_health_score(self, health_log: List[Dict]) -> float:
+    def _calculate_average_health_score(self) -> float:
         """
-        Calculate an average health score based on recent health logs.
-
-        Args:
-            health_log: List of health status dictionaries
+        Calculate the average health score over the last 24 hours.
 
         Returns:
             Average health score (0.0-1.0, where 1.0 is perfect health)
         """
-        if not health_log:
+        count = len(self._score_window)
+        if not count:
             return 1.0
-
-        # Look at last 24 hours of data
-        last_24h = datetime.now() - timedelta(hours=24)
-        recent_entries = [
-            entry for entry in health_log
-            if datetime.fromisoformat(entry['timestamp'].replace('Z', '+00:00')) >= last_24h
-        ]
-
-        if not recent_entries:
-            return 1.0
-
-        # Assign scores: critical=0.0, warning=0.5, ok=1.0
-        score_map = {'critical': 0.0, 'warning': 0.5, 'ok': 1.0}
-        scores = [score_map.get(entry.get('overall_health', 'ok'), 0.5) for entry in recent_entries]
-
-        return sum(scores) / len(scores) if scores else 1.0
+        return self._score_sum / count
 
 
 def get_health_monitor(vault_path: str) -> HealthMonitor:
@@ -0,0 +1,131 @@
+"""
+Retry Handler Module for the Personal AI Employee system.
+Provides per-service circuit breakers so callers stop hammering an
+external service (Odoo, social MCP servers) that is already failing.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict
+
+from utils.setup_logger import setup_logger
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker guarding calls to one external service.
+
+    The circuit is 'closed' while the service is healthy. After enough
+    consecutive failures it 'opens' and callers should back off; once the
+    reset timeout passes it becomes 'half_open' so one probe call can
+    decide whether to close it again.
+    """
+
+    def __init__(self, service_name: str, failure_threshold: int = 5,
+                 reset_timeout: int = 60):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            service_name: Name of the guarded service
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds before an open circuit allows a probe
+        """
+        self.service_name = service_name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = 'closed'
+        self.failure_count = 0
+        self._opened_at_mono = 0.0
+        self._lock = threading.Lock()
+        self.logger = setup_logger("CircuitBreaker", level=logging.INFO)
+
+    def record_success(self):
+        """Record a successful call, closing the circuit."""
+        with self._lock:
+            if self.state != 'closed':
+                self.logger.info(f"Circuit for {self.service_name} closed again")
+            self.state = 'closed'
+            self.failure_count = 0
+
+    def record_failure(self):
+        """Record a failed call, opening the circuit at the threshold."""
+        with self._lock:
+            self.failure_count += 1
+            if self.failure_count >= self.failure_threshold and self.state != 'open':
+                self.state = 'open'
+                self._opened_at_mono = time.monotonic()
+                self.logger.warning(
+                    f"Circuit for {self.service_name} opened after "
+                    f"{self.failure_count} failures")
+
+    def allow_request(self) -> bool:
+        """
+        Whether a call to the service may proceed right now.
+
+        Returns:
+            True if the circuit is closed, or open long enough to probe
+        """
+        with self._lock:
+            if self.state == 'closed':
+                return True
+            if time.monotonic() - self._opened_at_mono >= self.reset_timeout:
+                self.state = 'half_open'
+                return True
+            return False
+
+    def get_state(self) -> Dict:
+        """
+        Get a snapshot of the circuit state.
+
+        Returns:
+            Dictionary with service name, state, and failure count
+        """
+        with self._lock:
+            return {
+                'service': self.service_name,
+                'state': self.state,
+                'failure_count': self.failure_count,
+            }
+
+
+# Shared per-service breakers so every caller sees the same circuit state
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(service_name: str) -> CircuitBreaker:
+    """
+    Get the shared CircuitBreaker for a service, creating it on first use.
+
+    Args:
+        service_name: Name of the service
+
+    Returns:
+        CircuitBreaker instance for that service
+    """
+    breaker = _circuit_breakers.get(service_name)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _circuit_breakers.setdefault(
+                service_name, CircuitBreaker(service_name))
+    return breaker
+
+
+if __name__ == "__main__":
+    # Example usage
+    import logging
+
+    logging.basicConfig(level=logging.INFO)
+
+    breaker = get_circuit_breaker("odoo")
+    print(f"Initial state: {breaker.get_state()}")
+
+    for _ in range(5):
+        breaker.record_failure()
+    print(f"After failures: {breaker.get_state()}")
+    print(f"Allow request: {breaker.allow_request()}")
+
+    breaker.record_success()
+    print(f"After recovery: {breaker.get_state()}")
@@ -3,8 +3,10 @@ Logging utility module for the Personal AI Employee system.
 Provides consistent logging setup across all components.
 """
 
+import json
 import logging
 import os
+from datetime import datetime
 from pathlib import Path
 
 
@@ -80,6 +82,52 @@ def log_action(action_type: str, intent: str, result: str = None, logger=None):
     logger.info(log_msg)
 
 
+def log_structured_action(vault_path: str, action: str, actor: str = "ai_employee",
+                          service: str = None, parameters: dict = None,
+                          status: str = "success", logger=None) -> dict:
+    """
+    Append a structured action entry to the vault's daily audit log.
+
+    Entries are stored in <vault>/Logs/YYYY-MM-DD.json, one JSON object per
+    line, so that every action taken by the AI Employee can be audited later.
+
+    Args:
+        vault_path: Path to the Obsidian vault
+        action: Type of action performed (e.g., "email_send", "plan_created")
+        actor: Component that performed the action
+        service: Optional external service involved (e.g., "gmail", "odoo")
+        parameters: Optional dictionary of action parameters
+        status: Result status of the action ("success", "failure", etc.)
+        logger: Optional logger instance for error reporting
+
+    Returns:
+        The log entry dictionary that was written
+    """
+    now = datetime.now()
+    entry = {
+        'timestamp': now.isoformat(),
+        'action': action,
+        'actor': actor,
+        'service': service,
+        'parameters': parameters or {},
+        'result': {'status': status},
+    }
+
+    log_dir = Path(vault_path) / "Logs"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    log_file = log_dir / f"{now.strftime('%Y-%m-%d')}.json"
+
+    try:
+        with open(log_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, default=str) + '\n')
+    except IOError as e:
+        if logger is None:
+            logger = logging.getLogger(__name__)
+        logger.error(f"Could not write structured action log: {e}")
+
+    return entry
+
+
 if __name__ == "__main__":
     # Example usage
     logger = setup_logger("ExampleLogger")